@@ -291,9 +291,27 @@ def expand_entities(requested: List[str]) -> List[str]:
 class NullEmitter:
     """Sink emitter used during ID collection."""
 
+    def register_schema(self, table: str, columns: tuple[str, ...]) -> None:  # pragma: no cover - trivial
+        return
+
     def emit(self, table: str, row: Dict[str, object]) -> None:  # pragma: no cover - trivial
         return
 
+    def emit_tuple(self, table: str, row: tuple) -> None:  # pragma: no cover - trivial
+        return
+
+    def emit_many(self, table: str, rows: Iterable[Dict[str, object]]) -> None:  # pragma: no cover - trivial
+        # Drain the iterable: row generators may carry enum/ID collection
+        # side effects that must still run during the collect phase.
+        for _ in rows:
+            pass
+
+    def emit_tuples(self, table: str, rows: Iterable[tuple]) -> None:  # pragma: no cover - trivial
+        # Drain the iterable: row generators may carry enum/ID collection
+        # side effects that must still run during the collect phase.
+        for _ in rows:
+            pass
+
 
 def process_entities(
     phase: str,
@@ -5,10 +5,13 @@ import csv
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
 from .schema import TableDefinition
 
+# Rows buffered per table before handing a batch to csv.writer.writerows.
+_FLUSH_ROWS = 4096
+
 
 def _format_cell(value: Any) -> Any:
     """Coerce Python values into CSV-friendly representations."""
@@ -47,18 +50,35 @@ class CsvTableWriter:
         # self._handle.write("\ufeff")
         self._writer = csv.writer(self._handle, lineterminator="\n", delimiter=delimiter)
         self._writer.writerow(self.table.column_names)
+        self._pending: list[list[Any]] = []
 
     def write_row(self, row: Mapping[str, Any]) -> None:
         """Write a single row adhering to the table's column order."""
 
-        ordered_values = [_format_cell(row.get(column)) for column in self.table.column_names]
-        self._writer.writerow(ordered_values)
+        self._pending.append([_format_cell(row.get(column)) for column in self.table.column_names])
+        if len(self._pending) >= _FLUSH_ROWS:
+            self.flush()
+
+    def write_row_tuple(self, values: Sequence[Any]) -> None:
+        """Write a positional row already ordered to match the table's columns."""
+
+        self._pending.append([_format_cell(value) for value in values])
+        if len(self._pending) >= _FLUSH_ROWS:
+            self.flush()
 
     def write_rows(self, rows: Iterable[Mapping[str, Any]]) -> None:
         for row in rows:
             self.write_row(row)
 
+    def flush(self) -> None:
+        """Hand buffered rows to csv.writer in one writerows call."""
+
+        if self._pending:
+            self._writer.writerows(self._pending)
+            self._pending.clear()
+
     def close(self) -> None:
+        self.flush()
         self._handle.close()
 
     def __enter__(self) -> "CsvTableWriter":
@@ -100,9 +120,15 @@ class CsvWriterManager:
             self._writers[table_name] = writer
             return writer
 
+    def columns_for(self, table_name: str) -> List[str]:
+        return self._table_definitions[table_name].column_names
+
     def write_row(self, table_name: str, row: Mapping[str, Any]) -> None:
         self.writer_for(table_name).write_row(row)
 
+    def write_row_tuple(self, table_name: str, values: Sequence[Any]) -> None:
+        self.writer_for(table_name).write_row_tuple(values)
+
     def write_rows(self, table_name: str, rows: Iterable[Mapping[str, Any]]) -> None:
         self.writer_for(table_name).write_rows(rows)
 
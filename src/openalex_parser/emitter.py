@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Dict, Iterable, Mapping, MutableMapping, Sequence, Tuple
+from hashlib import blake2b
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Mapping, MutableMapping, Sequence, Tuple
 
 from .csv_writer import CsvWriterManager
 
@@ -10,8 +12,19 @@ Row = Mapping[str, object]
 KeyFields = Sequence[str]
 
 
-def _build_key(row: Row, fields: KeyFields) -> Tuple[object, ...]:
-    return tuple(row.get(field) for field in fields)
+def _hash_key(key: Tuple[object, ...]) -> int:
+    """Collapse a dedupe key to a 64-bit digest.
+
+    Storing digests instead of the original tuples keeps the seen-sets an
+    order of magnitude smaller for string-keyed tables; the birthday-collision
+    risk on 64 bits is negligible at snapshot scale.
+    """
+
+    digest = blake2b(digest_size=8)
+    for value in key:
+        digest.update(str(value).encode("utf-8"))
+        digest.update(b"\x1f")
+    return int.from_bytes(digest.digest(), "big")
 
 
 class TableEmitter:
@@ -20,22 +33,139 @@ class TableEmitter:
     def __init__(self, writers: CsvWriterManager, dedupe_keys: Mapping[str, KeyFields] | None = None) -> None:
         self._writers = writers
         self._dedupe_keys: Dict[str, KeyFields] = dict(dedupe_keys or {})
-        self._seen: Dict[str, set[Tuple[object, ...]]] = defaultdict(set)
+        self._seen: Dict[str, set[int]] = defaultdict(set)
+        self._key_indices: Dict[str, Tuple[int, ...]] = {}
+        # Single-column keys (the common case) skip tuple construction: the
+        # key is the bare value, hashed only when it is not already an int.
+        self._single_key_field: Dict[str, str] = {
+            table: fields[0] for table, fields in self._dedupe_keys.items() if len(fields) == 1
+        }
+        self._single_key_index: Dict[str, int] = {}
+        # Multi-column keys are extracted by C-level itemgetters compiled once
+        # per table. Rows are expected to carry their key fields; a missing
+        # field raising KeyError is a bug worth surfacing.
+        self._key_getters: Dict[str, Callable[[Row], Tuple[object, ...]]] = {
+            table: itemgetter(*fields)
+            for table, fields in self._dedupe_keys.items()
+            if len(fields) > 1
+        }
+        self._tuple_key_getters: Dict[str, Callable[[Tuple[object, ...]], Tuple[object, ...]]] = {}
 
-    def emit(self, table: str, row: Row) -> None:
+    def register_schema(self, table: str, columns: Sequence[str]) -> None:
+        """Validate *columns* against the table definition and prepare the tuple fast-path."""
+
+        expected = self._writers.columns_for(table)
+        if list(columns) != expected:
+            raise ValueError(
+                f"Registered column order for table {table} does not match the schema: "
+                f"{list(columns)} != {expected}"
+            )
         key_fields = self._dedupe_keys.get(table)
         if key_fields:
-            key = _build_key(row, key_fields)
-            if None in key:
-                raise ValueError(f"Missing key value for table {table}: {key}")
-            if key in self._seen[table]:
+            self._key_indices[table] = tuple(expected.index(field) for field in key_fields)
+            if len(key_fields) == 1:
+                self._single_key_index[table] = expected.index(key_fields[0])
+            else:
+                self._tuple_key_getters[table] = itemgetter(*self._key_indices[table])
+
+    def emit(self, table: str, row: Row) -> None:
+        field = self._single_key_field.get(table)
+        if field is not None:
+            value = row.get(field)
+            if value is None:
+                raise ValueError(f"Missing key value for table {table}: ({value},)")
+            hashed = value if type(value) is int else _hash_key((value,))
+            if hashed in self._seen[table]:
                 return
-            self._seen[table].add(key)
+            self._seen[table].add(hashed)
+        else:
+            getter = self._key_getters.get(table)
+            if getter is not None:
+                key = getter(row)
+                if None in key:
+                    raise ValueError(f"Missing key value for table {table}: {key}")
+                hashed = _hash_key(key)
+                if hashed in self._seen[table]:
+                    return
+                self._seen[table].add(hashed)
         self._writers.write_row(table, row)
 
+    def emit_tuple(self, table: str, row: Tuple[object, ...]) -> None:
+        """Emit a positional row matching the column order registered via ``register_schema``."""
+
+        index = self._single_key_index.get(table)
+        if index is not None:
+            value = row[index]
+            if value is None:
+                raise ValueError(f"Missing key value for table {table}: ({value},)")
+            hashed = value if type(value) is int else _hash_key((value,))
+            if hashed in self._seen[table]:
+                return
+            self._seen[table].add(hashed)
+        else:
+            getter = self._tuple_key_getters.get(table)
+            if getter is not None:
+                key = getter(row)
+                if None in key:
+                    raise ValueError(f"Missing key value for table {table}: {key}")
+                hashed = _hash_key(key)
+                if hashed in self._seen[table]:
+                    return
+                self._seen[table].add(hashed)
+        self._writers.write_row_tuple(table, row)
+
+    def emit_many(self, table: str, rows: Iterable[Row]) -> None:
+        """Emit a batch of mapping rows with one writer resolution."""
+
+        if table in self._dedupe_keys:
+            for row in rows:
+                self.emit(table, row)
+            return
+        write = self._writers.writer_for(table).write_row
+        for row in rows:
+            write(row)
+
+    def emit_tuples(self, table: str, rows: Iterable[Tuple[object, ...]]) -> None:
+        """Emit a batch of positional rows with one writer resolution."""
+
+        if table in self._key_indices:
+            for row in rows:
+                self.emit_tuple(table, row)
+            return
+        write = self._writers.writer_for(table).write_row_tuple
+        for row in rows:
+            write(row)
+
+
+class RowCollector:
+    """Emitter-compatible sink that collects (table, row) pairs in memory.
+
+    Backs the transformers' pull-based ``iter_rows`` API. Rows are collected
+    verbatim - cross-record dedupe is a property of the shared TableEmitter,
+    not of this sink.
+    """
+
+    def __init__(self) -> None:
+        self.rows: list[Tuple[str, object]] = []
+
+    def register_schema(self, table: str, columns: Sequence[str]) -> None:
+        return
+
+    def emit(self, table: str, row: Row) -> None:
+        self.rows.append((table, row))
+
+    def emit_tuple(self, table: str, row: Tuple[object, ...]) -> None:
+        self.rows.append((table, row))
+
     def emit_many(self, table: str, rows: Iterable[Row]) -> None:
+        append = self.rows.append
+        for row in rows:
+            append((table, row))
+
+    def emit_tuples(self, table: str, rows: Iterable[Tuple[object, ...]]) -> None:
+        append = self.rows.append
         for row in rows:
-            self.emit(table, row)
+            append((table, row))
 
 
-__all__ = ["TableEmitter"]
+__all__ = ["RowCollector", "TableEmitter"]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import csv
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
@@ -38,12 +39,14 @@ class IdCatalog:
         self.namespace_assignments: Dict[str, Dict[str, int]] = {}
 
     def record_enum(self, table: str, value: str) -> None:
+        # Interning lets set.add short-circuit on pointer identity for the
+        # millions of repeats of a few hundred distinct values.
         if value:
-            self._enum_values[table].add(value)
+            self._enum_values[table].add(sys.intern(value))
 
     def record_namespace(self, namespace: str, value: str) -> None:
         if value:
-            self._namespace_values[namespace].add(value)
+            self._namespace_values[namespace].add(sys.intern(value))
 
     def finalize(self, reference_dir: Path) -> None:
         """Assign IDs and write CSV files to *reference_dir*."""
@@ -58,7 +61,7 @@ class IdCatalog:
             self._write_records(
                 path,
                 (config.id_column, config.value_column),
-                ({config.id_column: identifier, config.value_column: value} for value, identifier in assignments.items()),
+                ((identifier, value) for value, identifier in assignments.items()),
             )
 
         self.namespace_assignments = {}
@@ -70,7 +73,7 @@ class IdCatalog:
             self._write_records(
                 path,
                 (config.id_column, config.value_column),
-                ({config.id_column: identifier, config.value_column: value} for value, identifier in assignments.items()),
+                ((identifier, value) for value, identifier in assignments.items()),
             )
 
     def load_existing(self, reference_dir: Path) -> bool:
@@ -99,17 +102,30 @@ class IdCatalog:
 
     @staticmethod
     def _assign(values: Set[str]) -> Dict[str, int]:
-        ordered = sorted(values, key=lambda text: (text.casefold(), text))
-        return {value: index for index, value in enumerate(ordered, start=1)}
+        # Decorate-sort-undecorate: computing casefold once per value and
+        # sorting plain tuples avoids the lambda-key dispatch per element.
+        decorated = [(value.casefold(), value) for value in values]
+        decorated.sort()
+        return {value: index for index, (_, value) in enumerate(decorated, start=1)}
 
     @staticmethod
-    def _write_records(path: Path, headers: Iterable[str], records: Iterable[Dict[str, object]]) -> None:
+    def _write_records(path: Path, headers: Iterable[str], records: Iterable[Sequence[object]]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=list(headers), delimiter="\t")
-            writer.writeheader()
-            for row in records:
-                writer.writerow(row)
+            write = handle.write
+            write("\t".join(headers) + "\n")
+            # Generated IDs and the overwhelming majority of values contain no
+            # delimiter or quote characters, so a plain join skips the csv
+            # module's per-field quoting; dirty values fall back to csv.
+            fallback = None
+            for identifier, value in records:
+                text = str(value)
+                if "\t" in text or "\n" in text or "\r" in text or '"' in text:
+                    if fallback is None:
+                        fallback = csv.writer(handle, delimiter="\t", lineterminator="\n")
+                    fallback.writerow((identifier, text))
+                else:
+                    write(f"{identifier}\t{text}\n")
 
     @staticmethod
     def _read_assignments(path: Path, id_column: str, value_column: str) -> Dict[str, int]:
@@ -1,4 +1,9 @@
-"""Deterministic identifier lookup backed by precomputed assignments."""
+"""Deterministic identifier lookup backed by precomputed assignments.
+
+IDs are assigned sequentially by :class:`~openalex_parser.id_catalog.IdCatalog`
+during the collect phase and only looked up here; no hashing happens on the
+parse hot path.
+"""
 from __future__ import annotations
 
 from typing import Callable, Dict, Mapping, Optional
@@ -12,23 +17,26 @@ class StableIdGenerator:
         assignments: Optional[Mapping[str, Mapping[str, int]]] = None,
         recorder: Optional[Callable[[str, str], None]] = None,
     ) -> None:
-        self._assignments: Dict[str, Dict[str, int]] = {
-            namespace: dict(values) for namespace, values in (assignments or {}).items()
-        }
+        # Share the caller's per-namespace maps instead of copying them: for a
+        # full snapshot these hold tens of millions of entries, and the
+        # catalog never mutates them after finalize/load.
+        self._assignments: Dict[str, Mapping[str, int]] = dict(assignments or {})
         self._recorder = recorder
+        # Both attributes are fixed after construction, so the hot path can
+        # branch on a single precomputed flag instead of re-testing them.
+        self._collecting = recorder is not None and not self._assignments
 
     def generate(self, namespace: str, value: str, bits: int = 63) -> int:  # bits maintained for compatibility
         if not value:
             raise ValueError("value must be a non-empty string")
-        if self._recorder is not None and not self._assignments:
+        if self._collecting:
             self._recorder(namespace, value)
             return 0
-        namespace_map = self._assignments.get(namespace)
-        if namespace_map is None:
-            raise KeyError(f"No assignments available for namespace '{namespace}'")
         try:
-            return namespace_map[value]
+            return self._assignments[namespace][value]
         except KeyError as exc:  # pragma: no cover - error path
+            if namespace not in self._assignments:
+                raise KeyError(f"No assignments available for namespace '{namespace}'") from exc
             raise KeyError(f"Value '{value}' missing from namespace '{namespace}' assignments") from exc
 
 
@@ -8,6 +8,8 @@ from typing import Callable, Dict, Optional
 
 from .emitter import TableEmitter
 
+_MISS = object()
+
 
 @dataclass
 class EnumerationConfig:
@@ -34,11 +36,15 @@ class EnumerationRegistry:
         self._configs: Dict[str, EnumerationConfig] = {}
         self._value_to_id: Dict[str, Dict[str, int]] = {}
         self._id_to_value: Dict[str, Dict[int, str]] = {}
+        # Memoises raw lookup values straight to resolved IDs so repeated
+        # values skip normalisation entirely.
+        self._resolve_cache: Dict[str, Dict[str, Optional[int]]] = {}
 
     def register(self, config: EnumerationConfig) -> None:
         self._configs[config.table] = config
         self._value_to_id.setdefault(config.table, {})
         self._id_to_value.setdefault(config.table, {})
+        self._resolve_cache.setdefault(config.table, {})
         if config.reference_filename and self._reference_dir:
             self._load_reference(config)
 
@@ -71,16 +77,24 @@ class EnumerationRegistry:
     def id_for(self, table: str, raw_value: Optional[str]) -> Optional[int]:
         if raw_value is None:
             return None
+        cache = self._resolve_cache[table]
+        hit = cache.get(raw_value, _MISS)
+        if hit is not _MISS:
+            return hit
         config = self._configs[table]
         value = self._normalise(config, raw_value)
         if not value:
+            cache[raw_value] = None
             return None
         table_map = self._value_to_id[table]
         if value in table_map:
-            return table_map[value]
+            identifier = table_map[value]
+            cache[raw_value] = identifier
+            return identifier
         if self._collector is not None:
             self._collector(table, value)
             table_map[value] = 0
+            cache[raw_value] = 0
             return 0
         raise KeyError(f"Value '{value}' not found in enumeration '{table}' assignments.")
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
@@ -40,64 +41,68 @@ def _normalise_identifier(identifier: str) -> str:
     return identifier
 
 
-def parse_schema(sql: str) -> Dict[str, TableDefinition]:
-    """Parse the CWTS SQL schema and return table definitions keyed by name."""
-
-    table_start_pattern = re.compile(r"CREATE TABLE\s+public\.([\"A-Za-z0-9_]+)\s*\(", re.IGNORECASE)
-    column_pattern = re.compile(r'^("?[A-Za-z0-9_]+"?)')
+_TABLE_BLOCK_PATTERN = re.compile(
+    r"^\s*CREATE TABLE\s+public\.([\"A-Za-z0-9_]+)\s*\((.*?)^\s*\)",
+    re.IGNORECASE | re.DOTALL | re.MULTILINE,
+)
+_TABLE_START_PATTERN = re.compile(r"^\s*CREATE TABLE\s+public\.[\"A-Za-z0-9_]+\s*\(", re.IGNORECASE | re.MULTILINE)
+_COLUMN_PATTERN = re.compile(r'^("?[A-Za-z0-9_]+"?)')
+_CONSTRAINT_PREFIXES = ("CONSTRAINT", "PRIMARY KEY", "UNIQUE", "FOREIGN KEY")
 
-    tables: Dict[str, TableDefinition] = {}
-    current_table_name: str | None = None
-    current_columns: List[ColumnDefinition] = []
 
-    for original_line in sql.splitlines():
+def _parse_columns(body: str) -> List[ColumnDefinition]:
+    columns: List[ColumnDefinition] = []
+    for original_line in body.splitlines():
         line = original_line.strip()
         if not line or line.startswith("--"):
             continue
-
-        table_match = table_start_pattern.match(line)
-        if table_match:
-            if current_table_name is not None:
-                raise ValueError(
-                    f"Encountered start of table definition for {table_match.group(1)} before closing "
-                    f"previous table {current_table_name}."
-                )
-            current_table_name = _normalise_identifier(table_match.group(1))
-            current_columns = []
-            continue
-
-        if current_table_name is None:
-            # Ignore everything until we hit the next CREATE TABLE statement.
-            continue
-
-        if line.startswith(")"):
-            tables[current_table_name] = TableDefinition(name=current_table_name, columns=current_columns)
-            current_table_name = None
-            current_columns = []
-            continue
-
-        upper_line = line.upper()
-        if upper_line.startswith("CONSTRAINT") or upper_line.startswith("PRIMARY KEY") or upper_line.startswith("UNIQUE") or upper_line.startswith("FOREIGN KEY"):
+        if line.upper().startswith(_CONSTRAINT_PREFIXES):
             continue
-
-        # Attempt to parse a column definition.
         working_line = line.rstrip(",")
-        column_match = column_pattern.match(working_line)
+        column_match = _COLUMN_PATTERN.match(working_line)
         if column_match:
             column_name = _normalise_identifier(column_match.group(1))
-            current_columns.append(ColumnDefinition(name=column_name, raw_definition=working_line))
+            columns.append(ColumnDefinition(name=column_name, raw_definition=working_line))
+    return columns
+
+
+def parse_schema(sql: str) -> Dict[str, TableDefinition]:
+    """Parse the CWTS SQL schema and return table definitions keyed by name."""
 
-    if current_table_name is not None:
-        raise ValueError(f"Unclosed table definition for {current_table_name} in schema file.")
+    tables: Dict[str, TableDefinition] = {}
+    matched_starts = 0
+    for match in _TABLE_BLOCK_PATTERN.finditer(sql):
+        raw_name, body = match.groups()
+        if _TABLE_START_PATTERN.search(body):
+            raise ValueError(
+                f"Encountered start of a new table definition before closing table {raw_name}."
+            )
+        name = _normalise_identifier(raw_name)
+        tables[name] = TableDefinition(name=name, columns=_parse_columns(body))
+        matched_starts += 1
+
+    total_starts = len(_TABLE_START_PATTERN.findall(sql))
+    if total_starts > matched_starts:
+        raise ValueError("Unclosed table definition in schema file.")
 
     return tables
 
 
+@lru_cache(maxsize=8)
+def _load_schema_cached(path: str, mtime_ns: int, size: int) -> Dict[str, TableDefinition]:
+    sql_text = Path(path).read_text(encoding="utf-8")
+    return parse_schema(sql_text)
+
+
 def load_schema(path: Path) -> Dict[str, TableDefinition]:
-    """Read an SQL schema file located at *path* and return table definitions."""
+    """Read an SQL schema file located at *path* and return table definitions.
 
-    sql_text = path.read_text(encoding="utf-8")
-    return parse_schema(sql_text)
+    Results are cached on (path, mtime, size) so repeated loads of the same
+    schema file are free.
+    """
+
+    stat = path.stat()
+    return _load_schema_cached(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 __all__ = ["ColumnDefinition", "TableDefinition", "parse_schema", "load_schema"]
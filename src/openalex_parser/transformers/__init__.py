@@ -1,24 +1,41 @@
-"""Entity-specific transformers for mapping OpenAlex JSON objects into table rows."""
-
-from .author import AuthorTransformer
-from .concept import ConceptTransformer
-from .funder import FunderTransformer
-from .institution import InstitutionTransformer
-from .publisher import PublisherTransformer
-from .source import SourceTransformer
-from .taxonomy import DomainTransformer, FieldTransformer, SubfieldTransformer, TopicTransformer
-from .work import WorkTransformer
-
-__all__ = [
-    "AuthorTransformer",
-    "ConceptTransformer",
-    "DomainTransformer",
-    "FieldTransformer",
-    "FunderTransformer",
-    "InstitutionTransformer",
-    "PublisherTransformer",
-    "SourceTransformer",
-    "SubfieldTransformer",
-    "TopicTransformer",
-    "WorkTransformer",
-]
+"""Entity-specific transformers for mapping OpenAlex JSON objects into table rows.
+
+Transformers receive records already parsed by :mod:`openalex_parser.json_iter`,
+which uses orjson when installed (falling back to the stdlib json module); any
+mapping supporting ``.get`` works as input.
+
+Transformer classes are imported lazily (PEP 562) so a CLI run that touches
+one entity does not pay the import cost of the other ten.
+"""
+
+import importlib
+
+_MODULE_BY_CLASS = {
+    "AuthorTransformer": "author",
+    "ConceptTransformer": "concept",
+    "DomainTransformer": "taxonomy",
+    "FieldTransformer": "taxonomy",
+    "FunderTransformer": "funder",
+    "InstitutionTransformer": "institution",
+    "PublisherTransformer": "publisher",
+    "SourceTransformer": "source",
+    "SubfieldTransformer": "taxonomy",
+    "TopicTransformer": "taxonomy",
+    "WorkTransformer": "work",
+}
+
+__all__ = sorted(_MODULE_BY_CLASS)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _MODULE_BY_CLASS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so subsequent lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
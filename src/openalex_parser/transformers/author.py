@@ -16,6 +16,26 @@ from ..utils import (
     safe_int,
 )
 
+# Positional row layouts; each tuple must match the schema column order.
+AUTHOR_COLUMNS = (
+    "author_id",
+    "author",
+    "orcid",
+    "openalex_id",
+    "scopus_id",
+    "wikipedia_url",
+    "updated_date",
+    "created_date",
+)
+AUTHOR_ALTERNATIVE_NAME_COLUMNS = ("author_id", "alternative_name_seq", "alternative_name")
+AUTHOR_INSTITUTION_COLUMNS = ("author_id", "institution_seq", "institution_id")
+AUTHOR_INSTITUTION_YEAR_COLUMNS = ("author_id", "institution_seq", "year_seq", "year")
+AUTHOR_LAST_KNOWN_INSTITUTION_COLUMNS = (
+    "author_id",
+    "last_known_institution_seq",
+    "last_known_institution_id",
+)
+
 
 class AuthorTransformer:
     """Map OpenAlex author JSON documents to relational rows."""
@@ -29,6 +49,17 @@ class AuthorTransformer:
         self._emitter = emitter
         self._enums = enums
         self._ids = id_generator
+        # Scratch sets reused across records to avoid a fresh allocation per
+        # author on the dedup paths.
+        self._name_dedup: set = set()
+        self._inst_dedup: set[int] = set()
+        emitter.register_schema("author", AUTHOR_COLUMNS)
+        emitter.register_schema("author_alternative_name", AUTHOR_ALTERNATIVE_NAME_COLUMNS)
+        emitter.register_schema("author_institution", AUTHOR_INSTITUTION_COLUMNS)
+        emitter.register_schema("author_institution_year", AUTHOR_INSTITUTION_YEAR_COLUMNS)
+        emitter.register_schema(
+            "author_last_known_institution", AUTHOR_LAST_KNOWN_INSTITUTION_COLUMNS
+        )
 
     def transform(self, record: Dict[str, object]) -> None:
         author_id = numeric_openalex_id(record.get("id"))
@@ -46,56 +77,52 @@ class AuthorTransformer:
         scopus_id = extract_scopus_author_id(ids.get("scopus"))
         wikipedia_url = ids.get("wikipedia")
 
-        self._emitter.emit(
+        self._emitter.emit_tuple(
             "author",
-            {
-                "author_id": author_id,
-                "author": record.get("display_name"),
-                "orcid": orcid,
-                "openalex_id": canonical_openalex_id(record.get("id")),
-                "scopus_id": scopus_id,
-                "wikipedia_url": wikipedia_url,
-                "updated_date": parse_iso_datetime(record.get("updated_date")),
-                "created_date": parse_iso_date(record.get("created_date")),
-            },
+            (
+                author_id,
+                record.get("display_name"),
+                orcid,
+                canonical_openalex_id(record.get("id")),
+                scopus_id,
+                wikipedia_url,
+                parse_iso_datetime(record.get("updated_date")),
+                parse_iso_date(record.get("created_date")),
+            ),
         )
 
     # ------------------------------------------------------------------
     def _emit_alternative_names(self, author_id: int, record: Dict[str, object]) -> None:
         alternatives = record.get("display_name_alternatives") or []
-        seen = set()
+        seen = self._name_dedup
+        seen.clear()
+        rows = []
         for idx, name in enumerate(alternatives, start=1):
             if not name or name in seen:
                 continue
             seen.add(name)
-            self._emitter.emit(
-                "author_alternative_name",
-                {
-                    "author_id": author_id,
-                    "alternative_name_seq": idx,
-                    "alternative_name": name,
-                },
-            )
+            rows.append((author_id, idx, name))
+        if rows:
+            self._emitter.emit_tuples("author_alternative_name", rows)
 
     # ------------------------------------------------------------------
     def _emit_affiliations(self, author_id: int, record: Dict[str, object]) -> None:
         affiliations: List[Dict[str, object]] = record.get("affiliations") or []
         inst_seq = 0
+        institution_rows = []
+        year_rows = []
         for affiliation in affiliations:
-            institution = affiliation.get("institution") if isinstance(affiliation, dict) else None
+            # One exact-type gate up front replaces the per-field isinstance
+            # branches; well-formed dumps always take the fast path.
+            if type(affiliation) is not dict:
+                continue
+            institution = affiliation.get("institution")
             institution_id = numeric_openalex_id(institution.get("id")) if institution else None
             if institution_id is None:
                 continue
             inst_seq += 1
-            self._emitter.emit(
-                "author_institution",
-                {
-                    "author_id": author_id,
-                    "institution_seq": inst_seq,
-                    "institution_id": institution_id,
-                },
-            )
-            years = affiliation.get("years") if isinstance(affiliation, dict) else None
+            institution_rows.append((author_id, inst_seq, institution_id))
+            years = affiliation.get("years")
             if years:
                 year_seq = 0
                 for year_value in years:
@@ -103,42 +130,35 @@ class AuthorTransformer:
                     if year_int is None:
                         continue
                     year_seq += 1
-                    self._emitter.emit(
-                        "author_institution_year",
-                        {
-                            "author_id": author_id,
-                            "institution_seq": inst_seq,
-                            "year_seq": year_seq,
-                            "year": year_int,
-                        },
-                    )
+                    year_rows.append((author_id, inst_seq, year_seq, year_int))
+        if institution_rows:
+            self._emitter.emit_tuples("author_institution", institution_rows)
+        if year_rows:
+            self._emitter.emit_tuples("author_institution_year", year_rows)
 
     # ------------------------------------------------------------------
     def _emit_last_known_institutions(self, author_id: int, record: Dict[str, object]) -> None:
         institutions: List[Dict[str, object]] = []
         last_known = record.get("last_known_institution")
-        if isinstance(last_known, dict):
+        if type(last_known) is dict:
             institutions.append(last_known)
         last_known_list = record.get("last_known_institutions")
-        if isinstance(last_known_list, list):
-            institutions.extend(inst for inst in last_known_list if isinstance(inst, dict))
+        if type(last_known_list) is list:
+            institutions.extend(inst for inst in last_known_list if type(inst) is dict)
 
-        seen_ids: set[int] = set()
+        seen_ids = self._inst_dedup
+        seen_ids.clear()
         seq = 0
+        rows = []
         for institution in institutions:
             institution_id = numeric_openalex_id(institution.get("id"))
             if institution_id is None or institution_id in seen_ids:
                 continue
             seen_ids.add(institution_id)
             seq += 1
-            self._emitter.emit(
-                "author_last_known_institution",
-                {
-                    "author_id": author_id,
-                    "last_known_institution_seq": seq,
-                    "last_known_institution_id": institution_id,
-                },
-            )
+            rows.append((author_id, seq, institution_id))
+        if rows:
+            self._emitter.emit_tuples("author_last_known_institution", rows)
 
 
 __all__ = ["AuthorTransformer"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Dict, Iterable, List, Optional
 
-from ..emitter import TableEmitter
+from ..emitter import RowCollector, TableEmitter
 from ..reference import EnumerationRegistry
 from ..identifiers import StableIdGenerator
 from ..utils import (
@@ -15,10 +15,41 @@ from ..utils import (
     safe_int,
 )
 
+# Shared read-only default for absent sub-dicts; never mutated.
+_EMPTY: Dict[str, object] = {}
+
+# Positional row layouts; each tuple must match the schema column order.
+CONCEPT_COLUMNS = (
+    "concept_id",
+    "concept",
+    "description",
+    "level",
+    "openalex_id",
+    "mag_id",
+    "wikidata_id",
+    "wikipedia_url",
+    "image_url",
+    "thumbnail_url",
+    "updated_date",
+    "created_date",
+)
+CONCEPT_ANCESTOR_COLUMNS = ("concept_id", "ancestor_concept_seq", "ancestor_concept_id")
+CONCEPT_INTERNATIONAL_NAME_COLUMNS = ("concept_id", "language_code", "concept_international_name")
+CONCEPT_INTERNATIONAL_DESCRIPTION_COLUMNS = (
+    "concept_id",
+    "language_code",
+    "concept_international_description",
+)
+CONCEPT_RELATED_COLUMNS = ("concept_id", "related_concept_seq", "related_concept_id", "score")
+CONCEPT_UMLS_CUI_COLUMNS = ("concept_id", "umls_cui_seq", "umls_cui")
+CONCEPT_UMLS_AUI_COLUMNS = ("concept_id", "umls_aui_seq", "umls_aui")
+
 
 class ConceptTransformer:
     """Map OpenAlex concept JSON documents to relational rows."""
 
+    __slots__ = ("_emitter", "_enums", "_ids")
+
     def __init__(
         self,
         emitter: TableEmitter,
@@ -28,143 +59,132 @@ class ConceptTransformer:
         self._emitter = emitter
         self._enums = enums
         self._ids = id_generator
+        emitter.register_schema("concept", CONCEPT_COLUMNS)
+        emitter.register_schema("concept_ancestor", CONCEPT_ANCESTOR_COLUMNS)
+        emitter.register_schema("concept_international_name", CONCEPT_INTERNATIONAL_NAME_COLUMNS)
+        emitter.register_schema(
+            "concept_international_description", CONCEPT_INTERNATIONAL_DESCRIPTION_COLUMNS
+        )
+        emitter.register_schema("concept_related", CONCEPT_RELATED_COLUMNS)
+        emitter.register_schema("concept_umls_cui", CONCEPT_UMLS_CUI_COLUMNS)
+        emitter.register_schema("concept_umls_aui", CONCEPT_UMLS_AUI_COLUMNS)
+
+    def iter_rows(self, record: Dict[str, object]):
+        """Yield (table, row) pairs for *record* instead of emitting them."""
+
+        collector = RowCollector()
+        type(self)(collector, self._enums, self._ids).transform(record)
+        return iter(collector.rows)
 
     def transform(self, record: Dict[str, object]) -> None:
-        concept_id = numeric_openalex_id(record.get("id"))
+        raw_id = record.get("id")
+        concept_id = numeric_openalex_id(raw_id)
         if concept_id is None:
             return
-        self._emit_concept(concept_id, record)
+        # Destructure the shared sub-dicts once; ids feeds both the main row
+        # and the UMLS helper.
+        ids = record.get("ids") or _EMPTY
+        international = record.get("international") or _EMPTY
+        self._emit_concept(concept_id, canonical_openalex_id(raw_id), record, ids)
         self._emit_ancestors(concept_id, record)
-        self._emit_international(concept_id, record)
+        self._emit_international(concept_id, international)
         self._emit_related(concept_id, record)
-        self._emit_umls(concept_id, record)
+        self._emit_umls(concept_id, ids)
 
     # ------------------------------------------------------------------
-    def _emit_concept(self, concept_id: int, record: Dict[str, object]) -> None:
-        ids = record.get("ids") or {}
+    def _emit_concept(
+        self,
+        concept_id: int,
+        openalex_id: Optional[str],
+        record: Dict[str, object],
+        ids: Dict[str, object],
+    ) -> None:
         wikidata_id = canonical_wikidata_id(ids.get("wikidata") or record.get("wikidata"))
         wikipedia_url = ids.get("wikipedia")
         mag_id = safe_int(ids.get("mag"))
 
-        self._emitter.emit(
+        self._emitter.emit_tuple(
             "concept",
-            {
-                "concept_id": concept_id,
-                "concept": record.get("display_name"),
-                "description": record.get("description"),
-                "level": record.get("level"),
-                "openalex_id": canonical_openalex_id(record.get("id")),
-                "mag_id": mag_id,
-                "wikidata_id": wikidata_id,
-                "wikipedia_url": wikipedia_url,
-                "image_url": record.get("image_url"),
-                "thumbnail_url": record.get("image_thumbnail_url"),
-                "updated_date": parse_iso_datetime(record.get("updated_date")),
-                "created_date": parse_iso_date(record.get("created_date")),
-            },
+            (
+                concept_id,
+                record.get("display_name"),
+                record.get("description"),
+                record.get("level"),
+                openalex_id,
+                mag_id,
+                wikidata_id,
+                wikipedia_url,
+                record.get("image_url"),
+                record.get("image_thumbnail_url"),
+                parse_iso_datetime(record.get("updated_date")),
+                parse_iso_date(record.get("created_date")),
+            ),
         )
 
     # ------------------------------------------------------------------
     def _emit_ancestors(self, concept_id: int, record: Dict[str, object]) -> None:
-        ancestors = record.get("ancestors") or []
-        seq = 0
+        ancestors = record.get("ancestors") or ()
+        rows = []
         for ancestor in ancestors:
-            ancestor_id = numeric_openalex_id(ancestor.get("id")) if isinstance(ancestor, dict) else numeric_openalex_id(ancestor)
+            ancestor_id = numeric_openalex_id(ancestor.get("id")) if type(ancestor) is dict else numeric_openalex_id(ancestor)
             if ancestor_id is None:
                 continue
-            seq += 1
-            self._emitter.emit(
-                "concept_ancestor",
-                {
-                    "concept_id": concept_id,
-                    "ancestor_concept_seq": seq,
-                    "ancestor_concept_id": ancestor_id,
-                },
-            )
+            rows.append((concept_id, len(rows) + 1, ancestor_id))
+        if rows:
+            self._emitter.emit_tuples("concept_ancestor", rows)
 
     # ------------------------------------------------------------------
-    def _emit_international(self, concept_id: int, record: Dict[str, object]) -> None:
-        international = record.get("international") or {}
-        names = international.get("display_name") or {}
-        descriptions = international.get("description") or {}
-
-        for language_code, value in sorted(names.items()):
-            if not value:
-                continue
-            self._emitter.emit(
+    def _emit_international(self, concept_id: int, international: Dict[str, object]) -> None:
+        names = international.get("display_name") or _EMPTY
+        descriptions = international.get("description") or _EMPTY
+
+        # Deterministic language order is part of the output contract; filter
+        # falsy values first so the sort only handles entries that will emit.
+        if names:
+            items = [(language_code, value) for language_code, value in names.items() if value]
+            items.sort()
+            self._emitter.emit_tuples(
                 "concept_international_name",
-                {
-                    "concept_id": concept_id,
-                    "language_code": language_code,
-                    "concept_international_name": value,
-                },
+                ((concept_id, language_code, value) for language_code, value in items),
             )
 
-        for language_code, value in sorted(descriptions.items()):
-            if not value:
-                continue
-            self._emitter.emit(
+        if descriptions:
+            items = [(language_code, value) for language_code, value in descriptions.items() if value]
+            items.sort()
+            self._emitter.emit_tuples(
                 "concept_international_description",
-                {
-                    "concept_id": concept_id,
-                    "language_code": language_code,
-                    "concept_international_description": value,
-                },
+                ((concept_id, language_code, value) for language_code, value in items),
             )
 
     # ------------------------------------------------------------------
     def _emit_related(self, concept_id: int, record: Dict[str, object]) -> None:
-        related = record.get("related_concepts") or []
-        seq = 0
+        related = record.get("related_concepts") or ()
+        rows = []
         for item in related:
-            if not isinstance(item, dict):
+            if type(item) is not dict:
                 continue
             related_id = numeric_openalex_id(item.get("id"))
             if related_id is None:
                 continue
-            seq += 1
-            self._emitter.emit(
-                "concept_related",
-                {
-                    "concept_id": concept_id,
-                    "related_concept_seq": seq,
-                    "related_concept_id": related_id,
-                    "score": item.get("score"),
-                },
-            )
+            rows.append((concept_id, len(rows) + 1, related_id, item.get("score")))
+        if rows:
+            self._emitter.emit_tuples("concept_related", rows)
 
     # ------------------------------------------------------------------
-    def _emit_umls(self, concept_id: int, record: Dict[str, object]) -> None:
-        ids = record.get("ids") or {}
-        umls_cui = ids.get("umls_cui") or []
-        umls_aui = ids.get("umls_aui") or []
-
-        seq = 0
-        for value in umls_cui:
-            if not value:
-                continue
-            seq += 1
-            self._emitter.emit(
+    def _emit_umls(self, concept_id: int, ids: Dict[str, object]) -> None:
+        umls_cui = ids.get("umls_cui") or ()
+        umls_aui = ids.get("umls_aui") or ()
+
+        if umls_cui:
+            self._emitter.emit_tuples(
                 "concept_umls_cui",
-                {
-                    "concept_id": concept_id,
-                    "umls_cui_seq": seq,
-                    "umls_cui": value,
-                },
+                ((concept_id, seq, value) for seq, value in enumerate(filter(None, umls_cui), start=1)),
             )
 
-        seq = 0
-        for value in umls_aui:
-            if not value:
-                continue
-            seq += 1
-            self._emitter.emit(
+        if umls_aui:
+            self._emitter.emit_tuples(
                 "concept_umls_aui",
-                {
-                    "concept_id": concept_id,
-                    "umls_aui_seq": seq,
-                    "umls_aui": value,
-                },
+                ((concept_id, seq, value) for seq, value in enumerate(filter(None, umls_aui), start=1)),
             )
 
 
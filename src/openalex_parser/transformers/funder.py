@@ -1,23 +1,48 @@
 """Transformer for funder entities."""
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
-from ..emitter import TableEmitter
+from ..emitter import RowCollector, TableEmitter
 from ..reference import EnumerationRegistry
 from ..identifiers import StableIdGenerator
 from ..utils import (
     canonical_openalex_id,
+    canonical_ror_id,
     canonical_wikidata_id,
+    dedupe_seq,
     numeric_openalex_id,
     parse_iso_date,
     parse_iso_datetime,
 )
 
+# Shared read-only default for absent sub-dicts; never mutated.
+_EMPTY: Dict[str, object] = {}
+
+# Positional row layouts; each tuple must match the schema column order.
+FUNDER_COLUMNS = (
+    "funder_id",
+    "funder",
+    "country_iso_alpha2_code",
+    "description",
+    "homepage_url",
+    "ror_id",
+    "openalex_id",
+    "wikidata_id",
+    "image_url",
+    "thumbnail_url",
+    "updated_date",
+    "created_date",
+)
+FUNDER_ALTERNATIVE_NAME_COLUMNS = ("funder_id", "alternative_name_seq", "alternative_name")
+FUNDER_PUBLISHER_COLUMNS = ("funder_id", "publisher_seq", "publisher_id")
+
 
 class FunderTransformer:
     """Map OpenAlex funder JSON documents to relational rows."""
 
+    __slots__ = ("_emitter", "_enums", "_ids")
+
     def __init__(
         self,
         emitter: TableEmitter,
@@ -27,81 +52,74 @@ class FunderTransformer:
         self._emitter = emitter
         self._enums = enums
         self._ids = id_generator
+        emitter.register_schema("funder", FUNDER_COLUMNS)
+        emitter.register_schema("funder_alternative_name", FUNDER_ALTERNATIVE_NAME_COLUMNS)
+        emitter.register_schema("funder_publisher", FUNDER_PUBLISHER_COLUMNS)
+
+    def iter_rows(self, record: Dict[str, object]):
+        """Yield (table, row) pairs for *record* instead of emitting them."""
+
+        collector = RowCollector()
+        type(self)(collector, self._enums, self._ids).transform(record)
+        return iter(collector.rows)
 
     def transform(self, record: Dict[str, object]) -> None:
-        funder_id = numeric_openalex_id(record.get("id"))
+        raw_id = record.get("id")
+        funder_id = numeric_openalex_id(raw_id)
         if funder_id is None:
             return
-        self._emit_funder(funder_id, record)
+        self._emit_funder(funder_id, canonical_openalex_id(raw_id), record)
         self._emit_alternative_names(funder_id, record)
         self._emit_publishers(funder_id, record)
 
     # ------------------------------------------------------------------
-    def _emit_funder(self, funder_id: int, record: Dict[str, object]) -> None:
-        ids = record.get("ids") or {}
+    def _emit_funder(self, funder_id: int, openalex_id: Optional[str], record: Dict[str, object]) -> None:
+        ids = record.get("ids") or _EMPTY
         wikidata_id = canonical_wikidata_id(ids.get("wikidata"))
         wikipedia_url = ids.get("wikipedia")
-        ror = ids.get("ror") or record.get("ror")
-        if ror:
-            ror = ror.rstrip("/").split("/")[-1]
+        ror = canonical_ror_id(ids.get("ror") or record.get("ror"))
 
-        self._emitter.emit(
+        self._emitter.emit_tuple(
             "funder",
-            {
-                "funder_id": funder_id,
-                "funder": record.get("display_name"),
-                "country_iso_alpha2_code": record.get("country_code"),
-                "description": record.get("description"),
-                "homepage_url": record.get("homepage_url"),
-                "ror_id": ror,
-                "openalex_id": canonical_openalex_id(record.get("id")),
-                "wikidata_id": wikidata_id,
-                "image_url": record.get("image_url"),
-                "thumbnail_url": record.get("image_thumbnail_url"),
-                "updated_date": parse_iso_datetime(record.get("updated_date")),
-                "created_date": parse_iso_date(record.get("created_date")),
-            },
+            (
+                funder_id,
+                record.get("display_name"),
+                record.get("country_code"),
+                record.get("description"),
+                record.get("homepage_url"),
+                ror,
+                openalex_id,
+                wikidata_id,
+                record.get("image_url"),
+                record.get("image_thumbnail_url"),
+                parse_iso_datetime(record.get("updated_date")),
+                parse_iso_date(record.get("created_date")),
+            ),
         )
 
     # ------------------------------------------------------------------
     def _emit_alternative_names(self, funder_id: int, record: Dict[str, object]) -> None:
-        alternatives = record.get("alternate_titles") or []
-        seq = 0
-        seen = set()
-        for name in alternatives:
-            if not name or name in seen:
-                continue
-            seen.add(name)
-            seq += 1
-            self._emitter.emit(
+        alternatives = record.get("alternate_titles") or ()
+        if alternatives:
+            self._emitter.emit_tuples(
                 "funder_alternative_name",
-                {
-                    "funder_id": funder_id,
-                    "alternative_name_seq": seq,
-                    "alternative_name": name,
-                },
+                ((funder_id, seq, name) for seq, name in dedupe_seq(alternatives)),
             )
 
     # ------------------------------------------------------------------
     def _emit_publishers(self, funder_id: int, record: Dict[str, object]) -> None:
-        roles = record.get("roles") or []
-        seq = 0
-        for role in roles:
-            if not isinstance(role, dict):
-                continue
-            if role.get("role") != "publisher":
-                continue
-            publisher_id = numeric_openalex_id(role.get("id"))
-            if publisher_id is None:
-                continue
-            seq += 1
-            self._emitter.emit(
+        # Fuse the filter/validate/collect steps into one comprehension pass.
+        publisher_ids = [
+            publisher_id
+            for role in record.get("roles") or ()
+            if type(role) is dict
+            and role.get("role") == "publisher"
+            and (publisher_id := numeric_openalex_id(role.get("id"))) is not None
+        ]
+        if publisher_ids:
+            self._emitter.emit_tuples(
                 "funder_publisher",
-                {
-                    "funder_id": funder_id,
-                    "publisher_seq": seq,
-                    "publisher_id": publisher_id,
-                },
+                ((funder_id, seq, pid) for seq, pid in enumerate(publisher_ids, start=1)),
             )
 
 
@@ -3,13 +3,15 @@ from __future__ import annotations
 
 from typing import Dict, Iterable, List, Optional
 
-from ..emitter import TableEmitter
+from ..emitter import RowCollector, TableEmitter
 from ..identifiers import StableIdGenerator
 from ..reference import EnumerationRegistry
 from ..utils import (
     bool_from_flag,
     canonical_openalex_id,
+    canonical_ror_id,
     canonical_wikidata_id,
+    dedupe_seq,
     numeric_openalex_id,
     parse_iso_date,
     parse_iso_datetime,
@@ -17,10 +19,60 @@ from ..utils import (
     safe_int,
 )
 
+# Shared read-only default for absent sub-dicts; never mutated.
+_EMPTY: Dict[str, object] = {}
+
+# Positional row layouts; each tuple must match the schema column order.
+INSTITUTION_COLUMNS = (
+    "institution_id",
+    "institution",
+    "institution_type_id",
+    "country_iso_alpha2_code",
+    "region_id",
+    "geonames_city_id",
+    "latitude",
+    "longitude",
+    "homepage_url",
+    "is_super_system",
+    "ror_id",
+    "grid_id",
+    "openalex_id",
+    "mag_id",
+    "wikidata_id",
+    "wikipedia_url",
+    "image_url",
+    "thumbnail_url",
+    "updated_date",
+    "created_date",
+)
+CITY_COLUMNS = ("geonames_city_id", "city")
+COUNTRY_COLUMNS = ("country_iso_alpha2_code", "country")
+INSTITUTION_ACRONYM_COLUMNS = ("institution_id", "acronym_seq", "acronym")
+INSTITUTION_ALTERNATIVE_NAME_COLUMNS = ("institution_id", "alternative_name_seq", "alternative_name")
+INSTITUTION_INTERNATIONAL_NAME_COLUMNS = (
+    "institution_id",
+    "language_code",
+    "institution_international_name",
+)
+INSTITUTION_ASSOCIATED_COLUMNS = (
+    "institution_id",
+    "associated_institution_seq",
+    "associated_institution_id",
+    "institution_relationship_type_id",
+)
+INSTITUTION_FUNDER_COLUMNS = ("institution_id", "funder_seq", "funder_id")
+INSTITUTION_PUBLISHER_COLUMNS = ("institution_id", "publisher_seq", "publisher_id")
+INSTITUTION_REPOSITORY_COLUMNS = ("institution_id", "repository_seq", "repository_source_id")
+INSTITUTION_LINEAGE_COLUMNS = ("institution_id", "lineage_institution_seq", "lineage_institution_id")
+
+_MISS = object()
+
 
 class InstitutionTransformer:
     """Map OpenAlex institution JSON documents to relational rows."""
 
+    __slots__ = ("_emitter", "_enums", "_ids", "_type_cache", "_relationship_cache")
+
     def __init__(
         self,
         emitter: TableEmitter,
@@ -30,12 +82,37 @@ class InstitutionTransformer:
         self._emitter = emitter
         self._enums = enums
         self._ids = id_generator
+        # Institution types and relationship types have single-digit
+        # cardinality; cache resolved IDs to skip the registry dispatch.
+        self._type_cache: Dict[object, Optional[int]] = {}
+        self._relationship_cache: Dict[object, Optional[int]] = {}
+        emitter.register_schema("institution", INSTITUTION_COLUMNS)
+        emitter.register_schema("city", CITY_COLUMNS)
+        emitter.register_schema("country", COUNTRY_COLUMNS)
+        emitter.register_schema("institution_acronym", INSTITUTION_ACRONYM_COLUMNS)
+        emitter.register_schema("institution_alternative_name", INSTITUTION_ALTERNATIVE_NAME_COLUMNS)
+        emitter.register_schema(
+            "institution_international_name", INSTITUTION_INTERNATIONAL_NAME_COLUMNS
+        )
+        emitter.register_schema("institution_associated", INSTITUTION_ASSOCIATED_COLUMNS)
+        emitter.register_schema("institution_funder", INSTITUTION_FUNDER_COLUMNS)
+        emitter.register_schema("institution_publisher", INSTITUTION_PUBLISHER_COLUMNS)
+        emitter.register_schema("institution_repository", INSTITUTION_REPOSITORY_COLUMNS)
+        emitter.register_schema("institution_lineage", INSTITUTION_LINEAGE_COLUMNS)
+
+    def iter_rows(self, record: Dict[str, object]):
+        """Yield (table, row) pairs for *record* instead of emitting them."""
+
+        collector = RowCollector()
+        type(self)(collector, self._enums, self._ids).transform(record)
+        return iter(collector.rows)
 
     def transform(self, record: Dict[str, object]) -> None:
-        institution_id = numeric_openalex_id(record.get("id"))
+        raw_id = record.get("id")
+        institution_id = numeric_openalex_id(raw_id)
         if institution_id is None:
             return
-        self._emit_institution(institution_id, record)
+        self._emit_institution(institution_id, canonical_openalex_id(raw_id), record)
         self._emit_acronyms(institution_id, record)
         self._emit_alternative_names(institution_id, record)
         self._emit_international_names(institution_id, record)
@@ -45,8 +122,13 @@ class InstitutionTransformer:
         self._emit_lineage(institution_id, record)
 
     # ------------------------------------------------------------------
-    def _emit_institution(self, institution_id: int, record: Dict[str, object]) -> None:
-        geo = record.get("geo") or {}
+    def _emit_institution(
+        self,
+        institution_id: int,
+        openalex_id: Optional[str],
+        record: Dict[str, object],
+    ) -> None:
+        geo = record.get("geo") or _EMPTY
         region_id = None
         region_name = geo.get("region")
         if region_name:
@@ -58,122 +140,88 @@ class InstitutionTransformer:
         city_id = safe_int(geo.get("geonames_city_id"))
         city_name = geo.get("city")
         if city_id and city_name:
-            self._emitter.emit(
-                "city",
-                {
-                    "geonames_city_id": city_id,
-                    "city": city_name,
-                },
-            )
+            self._emitter.emit_tuple("city", (city_id, city_name))
 
         country_code = record.get("country_code")
         country_name = geo.get("country")
         if country_code:
-            self._emitter.emit(
-                "country",
-                {
-                    "country_iso_alpha2_code": country_code,
-                    "country": country_name,
-                },
-            )
+            self._emitter.emit_tuple("country", (country_code, country_name))
 
-        ror = record.get("ror")
-        if ror:
-            ror = ror.rstrip("/").split("/")[-1]
+        ror = canonical_ror_id(record.get("ror"))
 
-        ids = record.get("ids") or {}
+        ids = record.get("ids") or _EMPTY
         wikipedia_url = ids.get("wikipedia")
         wikidata_id = canonical_wikidata_id(ids.get("wikidata"))
         mag_id = safe_int(ids.get("mag"))
 
-        institution_type_id = self._enums.id_for("institution_type", record.get("type"))
+        raw_type = record.get("type")
+        institution_type_id = self._type_cache.get(raw_type, _MISS)
+        if institution_type_id is _MISS:
+            institution_type_id = self._enums.id_for("institution_type", raw_type)
+            self._type_cache[raw_type] = institution_type_id
 
-        self._emitter.emit(
+        self._emitter.emit_tuple(
             "institution",
-            {
-                "institution_id": institution_id,
-                "institution": record.get("display_name"),
-                "institution_type_id": institution_type_id,
-                "country_iso_alpha2_code": country_code,
-                "region_id": region_id,
-                "geonames_city_id": city_id,
-                "latitude": safe_float(geo.get("latitude")),
-                "longitude": safe_float(geo.get("longitude")),
-                "homepage_url": record.get("homepage_url"),
-                "is_super_system": bool_from_flag(record.get("is_super_system")),
-                "ror_id": ror,
-                "grid_id": ids.get("grid"),
-                "openalex_id": canonical_openalex_id(record.get("id")),
-                "mag_id": mag_id,
-                "wikidata_id": wikidata_id,
-                "wikipedia_url": wikipedia_url,
-                "image_url": record.get("image_url"),
-                "thumbnail_url": record.get("image_thumbnail_url"),
-                "updated_date": parse_iso_datetime(record.get("updated_date")),
-                "created_date": parse_iso_date(record.get("created_date")),
-            },
+            (
+                institution_id,
+                record.get("display_name"),
+                institution_type_id,
+                country_code,
+                region_id,
+                city_id,
+                safe_float(geo.get("latitude")),
+                safe_float(geo.get("longitude")),
+                record.get("homepage_url"),
+                bool_from_flag(record.get("is_super_system")),
+                ror,
+                ids.get("grid"),
+                openalex_id,
+                mag_id,
+                wikidata_id,
+                wikipedia_url,
+                record.get("image_url"),
+                record.get("image_thumbnail_url"),
+                parse_iso_datetime(record.get("updated_date")),
+                parse_iso_date(record.get("created_date")),
+            ),
         )
 
     # ------------------------------------------------------------------
     def _emit_acronyms(self, institution_id: int, record: Dict[str, object]) -> None:
-        acronyms = record.get("display_name_acronyms") or []
-        seen = set()
-        seq = 0
-        for acronym in acronyms:
-            if not acronym or acronym in seen:
-                continue
-            seen.add(acronym)
-            seq += 1
-            self._emitter.emit(
+        acronyms = record.get("display_name_acronyms") or ()
+        if acronyms:
+            self._emitter.emit_tuples(
                 "institution_acronym",
-                {
-                    "institution_id": institution_id,
-                    "acronym_seq": seq,
-                    "acronym": acronym,
-                },
+                ((institution_id, seq, acronym) for seq, acronym in dedupe_seq(acronyms)),
             )
 
     # ------------------------------------------------------------------
     def _emit_alternative_names(self, institution_id: int, record: Dict[str, object]) -> None:
-        names = record.get("display_name_alternatives") or []
-        seen = set()
-        seq = 0
-        for name in names:
-            if not name or name in seen:
-                continue
-            seen.add(name)
-            seq += 1
-            self._emitter.emit(
+        names = record.get("display_name_alternatives") or ()
+        if names:
+            self._emitter.emit_tuples(
                 "institution_alternative_name",
-                {
-                    "institution_id": institution_id,
-                    "alternative_name_seq": seq,
-                    "alternative_name": name,
-                },
+                ((institution_id, seq, name) for seq, name in dedupe_seq(names)),
             )
 
     # ------------------------------------------------------------------
     def _emit_international_names(self, institution_id: int, record: Dict[str, object]) -> None:
-        international = record.get("international") or {}
-        names = international.get("display_name") or {}
-        for language_code, name in sorted(names.items()):
-            if not name:
-                continue
-            self._emitter.emit(
+        international = record.get("international") or _EMPTY
+        names = international.get("display_name") or _EMPTY
+        if names:
+            items = [(language_code, name) for language_code, name in names.items() if name]
+            items.sort()
+            self._emitter.emit_tuples(
                 "institution_international_name",
-                {
-                    "institution_id": institution_id,
-                    "language_code": language_code,
-                    "institution_international_name": name,
-                },
+                ((institution_id, language_code, name) for language_code, name in items),
             )
 
     # ------------------------------------------------------------------
     def _emit_associated(self, institution_id: int, record: Dict[str, object]) -> None:
-        associated = record.get("associated_institutions") or []
+        associated = record.get("associated_institutions") or ()
         seq = 0
         for item in associated:
-            if not isinstance(item, dict):
+            if type(item) is not dict:
                 continue
             associated_id = numeric_openalex_id(item.get("id"))
             if associated_id is None:
@@ -181,86 +229,62 @@ class InstitutionTransformer:
             relationship = item.get("relationship")
             relationship_type_id = None
             if relationship:
-                relationship_type_id = self._enums.id_for("institution_relationship_type", relationship)
+                relationship_type_id = self._relationship_cache.get(relationship, _MISS)
+                if relationship_type_id is _MISS:
+                    relationship_type_id = self._enums.id_for(
+                        "institution_relationship_type", relationship
+                    )
+                    self._relationship_cache[relationship] = relationship_type_id
             seq += 1
-            self._emitter.emit(
+            self._emitter.emit_tuple(
                 "institution_associated",
-                {
-                    "institution_id": institution_id,
-                    "associated_institution_seq": seq,
-                    "associated_institution_id": associated_id,
-                    "institution_relationship_type_id": relationship_type_id,
-                },
+                (institution_id, seq, associated_id, relationship_type_id),
             )
 
     # ------------------------------------------------------------------
     def _emit_roles(self, institution_id: int, record: Dict[str, object]) -> None:
-        roles = record.get("roles") or []
+        roles = record.get("roles") or ()
+        emit = self._emitter.emit_tuple
+        numeric_id = numeric_openalex_id
         funder_seq = 0
         publisher_seq = 0
         for role in roles:
-            if not isinstance(role, dict):
+            if type(role) is not dict:
                 continue
             role_type = role.get("role")
-            role_id = numeric_openalex_id(role.get("id"))
+            role_id = numeric_id(role.get("id"))
             if role_type == "funder" and role_id is not None:
                 funder_seq += 1
-                self._emitter.emit(
-                    "institution_funder",
-                    {
-                        "institution_id": institution_id,
-                        "funder_seq": funder_seq,
-                        "funder_id": role_id,
-                    },
-                )
+                emit("institution_funder", (institution_id, funder_seq, role_id))
             elif role_type == "publisher" and role_id is not None:
                 publisher_seq += 1
-                self._emitter.emit(
-                    "institution_publisher",
-                    {
-                        "institution_id": institution_id,
-                        "publisher_seq": publisher_seq,
-                        "publisher_id": role_id,
-                    },
-                )
+                emit("institution_publisher", (institution_id, publisher_seq, role_id))
 
     # ------------------------------------------------------------------
     def _emit_repositories(self, institution_id: int, record: Dict[str, object]) -> None:
-        repositories = record.get("repositories") or []
-        seq = 0
+        repositories = record.get("repositories") or ()
+        rows = []
         for repo in repositories:
-            if not isinstance(repo, dict):
+            if type(repo) is not dict:
                 continue
             source_id = numeric_openalex_id(repo.get("id"))
             if source_id is None:
                 continue
-            seq += 1
-            self._emitter.emit(
-                "institution_repository",
-                {
-                    "institution_id": institution_id,
-                    "repository_seq": seq,
-                    "repository_source_id": source_id,
-                },
-            )
+            rows.append((institution_id, len(rows) + 1, source_id))
+        if rows:
+            self._emitter.emit_tuples("institution_repository", rows)
 
     # ------------------------------------------------------------------
     def _emit_lineage(self, institution_id: int, record: Dict[str, object]) -> None:
-        lineage = record.get("lineage") or []
-        seq = 0
-        for value in lineage:
+        lineage = record.get("lineage") or ()
+        rows = []
+        for value in filter(None, lineage):
             lineage_id = numeric_openalex_id(value)
             if lineage_id is None:
                 continue
-            seq += 1
-            self._emitter.emit(
-                "institution_lineage",
-                {
-                    "institution_id": institution_id,
-                    "lineage_institution_seq": seq,
-                    "lineage_institution_id": lineage_id,
-                },
-            )
+            rows.append((institution_id, len(rows) + 1, lineage_id))
+        if rows:
+            self._emitter.emit_tuples("institution_lineage", rows)
 
 
 __all__ = ["InstitutionTransformer"]
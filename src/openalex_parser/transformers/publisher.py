@@ -1,23 +1,48 @@
 """Transformer for publisher entities."""
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
-from ..emitter import TableEmitter
+from ..emitter import RowCollector, TableEmitter
 from ..reference import EnumerationRegistry
 from ..identifiers import StableIdGenerator
 from ..utils import (
     canonical_openalex_id,
+    canonical_ror_id,
     canonical_wikidata_id,
+    dedupe_seq,
     numeric_openalex_id,
     parse_iso_date,
     parse_iso_datetime,
 )
 
+# Shared read-only default for absent sub-dicts; never mutated.
+_EMPTY: Dict[str, object] = {}
+
+# Positional row layouts; each tuple must match the schema column order.
+PUBLISHER_COLUMNS = (
+    "publisher_id",
+    "publisher",
+    "hierarchy_level",
+    "parent_publisher_id",
+    "homepage_url",
+    "ror_id",
+    "openalex_id",
+    "wikidata_id",
+    "image_url",
+    "thumbnail_url",
+    "updated_date",
+    "created_date",
+)
+PUBLISHER_ALTERNATIVE_NAME_COLUMNS = ("publisher_id", "alternative_name_seq", "alternative_name")
+PUBLISHER_COUNTRY_COLUMNS = ("publisher_id", "country_seq", "country_iso_alpha2_code")
+
 
 class PublisherTransformer:
     """Map OpenAlex publisher JSON documents to relational rows."""
 
+    __slots__ = ("_emitter", "_enums", "_ids")
+
     def __init__(
         self,
         emitter: TableEmitter,
@@ -27,80 +52,68 @@ class PublisherTransformer:
         self._emitter = emitter
         self._enums = enums
         self._ids = id_generator
+        emitter.register_schema("publisher", PUBLISHER_COLUMNS)
+        emitter.register_schema("publisher_alternative_name", PUBLISHER_ALTERNATIVE_NAME_COLUMNS)
+        emitter.register_schema("publisher_country", PUBLISHER_COUNTRY_COLUMNS)
+
+    def iter_rows(self, record: Dict[str, object]):
+        """Yield (table, row) pairs for *record* instead of emitting them."""
+
+        collector = RowCollector()
+        type(self)(collector, self._enums, self._ids).transform(record)
+        return iter(collector.rows)
 
     def transform(self, record: Dict[str, object]) -> None:
-        publisher_id = numeric_openalex_id(record.get("id"))
+        raw_id = record.get("id")
+        publisher_id = numeric_openalex_id(raw_id)
         if publisher_id is None:
             return
-        self._emit_publisher(publisher_id, record)
+        self._emit_publisher(publisher_id, canonical_openalex_id(raw_id), record)
         self._emit_alternative_names(publisher_id, record)
         self._emit_countries(publisher_id, record)
 
     # ------------------------------------------------------------------
-    def _emit_publisher(self, publisher_id: int, record: Dict[str, object]) -> None:
-        ids = record.get("ids") or {}
+    def _emit_publisher(self, publisher_id: int, openalex_id: Optional[str], record: Dict[str, object]) -> None:
+        ids = record.get("ids") or _EMPTY
         wikidata_id = canonical_wikidata_id(ids.get("wikidata"))
-        wikipedia_url = ids.get("wikipedia")
-        ror = ids.get("ror")
-        if ror:
-            ror = ror.rstrip("/").split("/")[-1]
-        parent = record.get("parent_publisher") or {}
-        parent_id = numeric_openalex_id(parent.get("id")) if isinstance(parent, dict) else None
-
-        self._emitter.emit(
+        ror = canonical_ror_id(ids.get("ror"))
+        parent = record.get("parent_publisher") or _EMPTY
+        parent_id = numeric_openalex_id(parent.get("id")) if type(parent) is dict else None
+
+        self._emitter.emit_tuple(
             "publisher",
-            {
-                "publisher_id": publisher_id,
-                "publisher": record.get("display_name"),
-                "hierarchy_level": record.get("hierarchy_level"),
-                "parent_publisher_id": parent_id,
-                "homepage_url": record.get("homepage_url"),
-                "ror_id": ror,
-                "openalex_id": canonical_openalex_id(record.get("id")),
-                "wikidata_id": wikidata_id,
-                "image_url": record.get("image_url"),
-                "thumbnail_url": record.get("image_thumbnail_url"),
-                "updated_date": parse_iso_datetime(record.get("updated_date")),
-                "created_date": parse_iso_date(record.get("created_date")),
-            },
+            (
+                publisher_id,
+                record.get("display_name"),
+                record.get("hierarchy_level"),
+                parent_id,
+                record.get("homepage_url"),
+                ror,
+                openalex_id,
+                wikidata_id,
+                record.get("image_url"),
+                record.get("image_thumbnail_url"),
+                parse_iso_datetime(record.get("updated_date")),
+                parse_iso_date(record.get("created_date")),
+            ),
         )
 
     # ------------------------------------------------------------------
     def _emit_alternative_names(self, publisher_id: int, record: Dict[str, object]) -> None:
-        names = record.get("alternate_titles") or []
-        seen = set()
-        seq = 0
-        for name in names:
-            if not name or name in seen:
-                continue
-            seen.add(name)
-            seq += 1
-            self._emitter.emit(
+        names = record.get("alternate_titles") or ()
+        if names:
+            self._emitter.emit_tuples(
                 "publisher_alternative_name",
-                {
-                    "publisher_id": publisher_id,
-                    "alternative_name_seq": seq,
-                    "alternative_name": name,
-                },
+                ((publisher_id, seq, name) for seq, name in dedupe_seq(names)),
             )
 
     # ------------------------------------------------------------------
     def _emit_countries(self, publisher_id: int, record: Dict[str, object]) -> None:
-        country_codes = record.get("country_codes") or []
-        seq = 0
-        seen = set()
-        for code in country_codes:
-            if not code or code in seen:
-                continue
-            seen.add(code)
-            seq += 1
-            self._emitter.emit(
+        country_codes = record.get("country_codes") or ()
+        if country_codes:
+            self._emitter.emit_tuples(
                 "publisher_country",
-                {
-                    "publisher_id": publisher_id,
-                    "country_seq": seq,
-                    "country_iso_alpha2_code": code,
-                },
+                ((publisher_id, seq, code) for seq, code in dedupe_seq(country_codes)),
             )
 
 
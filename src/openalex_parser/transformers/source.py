@@ -4,6 +4,11 @@ from __future__ import annotations
 import re
 from typing import Dict
 
+try:
+    import re2  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
+
 from ..emitter import TableEmitter
 from ..reference import EnumerationRegistry
 from ..identifiers import StableIdGenerator
@@ -11,18 +16,75 @@ from ..utils import (
     bool_from_flag,
     canonical_openalex_id,
     canonical_wikidata_id,
+    dedupe_seq,
     numeric_openalex_id,
     parse_iso_date,
     parse_iso_datetime,
     safe_int,
 )
 
-ISSN_PATTERN = re.compile(r"\d{4}-\d{3}[\dX]")
+# Positional row layouts; each tuple must match the schema column order.
+SOURCE_COLUMNS = (
+    "source_id",
+    "source",
+    "abbreviation",
+    "source_type_id",
+    "country_iso_alpha2_code",
+    "host_organization_publisher_id",
+    "host_organization_institution_id",
+    "homepage_url",
+    "issn_l",
+    "openalex_id",
+    "mag_id",
+    "wikidata_id",
+    "fatcat_id",
+    "is_in_doaj",
+    "is_oa",
+    "apc_price_usd",
+    "updated_date",
+    "created_date",
+)
+SOURCE_ALTERNATIVE_TITLE_COLUMNS = ("source_id", "alternative_title_seq", "alternative_title")
+SOURCE_APC_PRICE_COLUMNS = ("source_id", "apc_price_seq", "apc_price", "currency")
+SOURCE_ISSN_COLUMNS = ("source_id", "issn_seq", "issn")
+SOURCE_SOCIETY_COLUMNS = ("source_id", "society_seq", "society", "homepage_url")
+
+_MISS = object()
+
+# Host organizations are publisher (P...) or institution (I...) IDs; route on
+# the first character via one dict probe instead of chained comparisons.
+_HOST_DISPATCH = {"P": 0, "I": 1}
+
+# google-re2 compiles the pattern to a linear-time DFA; the stdlib
+# backtracking engine is the fallback, mirroring the orjson convention.
+ISSN_PATTERN = (re2 or re).compile(r"\d{4}-\d{3}[\dX]")
+# Bound method saves an attribute load per call on the per-ISSN hot path.
+_ISSN_SEARCH = ISSN_PATTERN.search
+
+
+def _fast_issn(text: str) -> str | None:
+    """Validate a canonical 9-character ISSN without entering the regex engine.
+
+    Equivalent to ``ISSN_PATTERN.fullmatch`` for uppercased input; dirty
+    values fall back to the regex search in the caller.
+    """
+
+    if len(text) != 9 or text[4] != "-":
+        return None
+    for index in (0, 1, 2, 3, 5, 6, 7):
+        if not "0" <= text[index] <= "9":
+            return None
+    last = text[8]
+    if "0" <= last <= "9" or last == "X":
+        return text
+    return None
 
 
 class SourceTransformer:
     """Map OpenAlex source JSON documents to relational rows."""
 
+    __slots__ = ("_emitter", "_enums", "_ids", "_source_type_cache")
+
     def __init__(
         self,
         emitter: TableEmitter,
@@ -32,90 +94,104 @@ class SourceTransformer:
         self._emitter = emitter
         self._enums = enums
         self._ids = id_generator
+        # Source types have ~20 distinct values; cache resolved IDs to skip
+        # the registry dispatch per record.
+        self._source_type_cache: Dict[object, object] = {}
+        emitter.register_schema("source", SOURCE_COLUMNS)
+        emitter.register_schema("source_alternative_title", SOURCE_ALTERNATIVE_TITLE_COLUMNS)
+        emitter.register_schema("source_apc_price", SOURCE_APC_PRICE_COLUMNS)
+        emitter.register_schema("source_issn", SOURCE_ISSN_COLUMNS)
+        emitter.register_schema("source_society", SOURCE_SOCIETY_COLUMNS)
 
     def transform(self, record: Dict[str, object]) -> None:
-        source_id = numeric_openalex_id(record.get("id"))
+        rget = record.get
+        source_id = numeric_openalex_id(rget("id"))
         if source_id is None:
             return
         self._emit_source(source_id, record)
-        self._emit_alternative_titles(source_id, record)
-        self._emit_apc_prices(source_id, record)
-        self._emit_issn(source_id, record)
-        self._emit_societies(source_id, record)
+        # Guard the child emits here so records lacking a field skip the
+        # helper call (and its frame) entirely.
+        titles = rget("alternate_titles")
+        if titles:
+            self._emit_alternative_titles(source_id, titles)
+        prices = rget("apc_prices")
+        if prices:
+            self._emit_apc_prices(source_id, prices)
+        issns = rget("issn") or (rget("ids") or {}).get("issn")
+        if issns:
+            self._emit_issn(source_id, issns)
+        societies = rget("societies")
+        if societies:
+            self._emit_societies(source_id, societies)
 
     # ------------------------------------------------------------------
     def _emit_source(self, source_id: int, record: Dict[str, object]) -> None:
-        ids = record.get("ids") or {}
-        wikidata_id = canonical_wikidata_id(ids.get("wikidata"))
-        fatcat_url = ids.get("fatcat")
+        rget = record.get
+        ids = rget("ids") or {}
+        iget = ids.get
+        wikidata_id = canonical_wikidata_id(iget("wikidata"))
+        fatcat_url = iget("fatcat")
         fatcat_id = None
         if fatcat_url:
-            fatcat_id = fatcat_url.rstrip("/").split("/")[-1]
-        mag_id = safe_int(ids.get("mag"))
-        issn_l = self._normalize_issn(record.get("issn_l") or ids.get("issn_l"))
+            # rpartition avoids allocating a list of every path segment.
+            fatcat_id = fatcat_url.rstrip("/").rpartition("/")[2] or None
+        mag_id = safe_int(iget("mag"))
+        issn_l = self._normalize_issn(rget("issn_l") or iget("issn_l"))
 
-        source_type_id = self._enums.id_for("source_type", record.get("type"))
+        raw_type = rget("type")
+        source_type_id = self._source_type_cache.get(raw_type, _MISS)
+        if source_type_id is _MISS:
+            source_type_id = self._enums.id_for("source_type", raw_type)
+            self._source_type_cache[raw_type] = source_type_id
 
         host_publisher_id = None
         host_institution_id = None
-        host_org = canonical_openalex_id(record.get("host_organization"))
+        host_org = canonical_openalex_id(rget("host_organization"))
         if host_org:
-            if host_org.startswith("P"):
+            slot = _HOST_DISPATCH.get(host_org[0])
+            if slot == 0:
                 host_publisher_id = numeric_openalex_id(host_org)
-            elif host_org.startswith("I"):
+            elif slot == 1:
                 host_institution_id = numeric_openalex_id(host_org)
         if host_publisher_id is None:
-            publisher_id = canonical_openalex_id(record.get("publisher_id"))
-            if publisher_id and publisher_id.startswith("P"):
+            publisher_id = canonical_openalex_id(rget("publisher_id"))
+            if publisher_id and publisher_id[0] == "P":
                 host_publisher_id = numeric_openalex_id(publisher_id)
 
-        self._emitter.emit(
+        self._emitter.emit_tuple(
             "source",
-            {
-                "source_id": source_id,
-                "source": record.get("display_name"),
-                "abbreviation": record.get("abbreviated_title"),
-                "source_type_id": source_type_id,
-                "country_iso_alpha2_code": record.get("country_code"),
-                "host_organization_publisher_id": host_publisher_id,
-                "host_organization_institution_id": host_institution_id,
-                "homepage_url": record.get("homepage_url"),
-                "issn_l": issn_l,
-                "openalex_id": canonical_openalex_id(record.get("id")),
-                "mag_id": mag_id,
-                "wikidata_id": wikidata_id,
-                "fatcat_id": fatcat_id,
-                "is_in_doaj": bool_from_flag(record.get("is_in_doaj")),
-                "is_oa": bool_from_flag(record.get("is_oa")),
-                "apc_price_usd": safe_int(record.get("apc_usd")),
-                "updated_date": parse_iso_datetime(record.get("updated_date")),
-                "created_date": parse_iso_date(record.get("created_date")),
-            },
+            (
+                source_id,
+                rget("display_name"),
+                rget("abbreviated_title"),
+                source_type_id,
+                rget("country_code"),
+                host_publisher_id,
+                host_institution_id,
+                rget("homepage_url"),
+                issn_l,
+                canonical_openalex_id(rget("id")),
+                mag_id,
+                wikidata_id,
+                fatcat_id,
+                bool_from_flag(rget("is_in_doaj")),
+                bool_from_flag(rget("is_oa")),
+                safe_int(rget("apc_usd")),
+                parse_iso_datetime(rget("updated_date")),
+                parse_iso_date(rget("created_date")),
+            ),
         )
 
     # ------------------------------------------------------------------
-    def _emit_alternative_titles(self, source_id: int, record: Dict[str, object]) -> None:
-        titles = record.get("alternate_titles") or []
-        seen = set()
-        seq = 0
-        for title in titles:
-            if not title or title in seen:
-                continue
-            seen.add(title)
-            seq += 1
-            self._emitter.emit(
-                "source_alternative_title",
-                {
-                    "source_id": source_id,
-                    "alternative_title_seq": seq,
-                    "alternative_title": title,
-                },
-            )
+    def _emit_alternative_titles(self, source_id: int, titles: list) -> None:
+        self._emitter.emit_tuples(
+            "source_alternative_title",
+            ((source_id, seq, title) for seq, title in dedupe_seq(titles)),
+        )
 
     # ------------------------------------------------------------------
-    def _emit_apc_prices(self, source_id: int, record: Dict[str, object]) -> None:
-        prices = record.get("apc_prices") or []
-        seq = 0
+    def _emit_apc_prices(self, source_id: int, prices: list) -> None:
+        rows = []
         for price in prices:
             if not isinstance(price, dict):
                 continue
@@ -123,61 +199,48 @@ class SourceTransformer:
             currency = price.get("currency")
             if value is None or not currency:
                 continue
-            seq += 1
-            self._emitter.emit(
-                "source_apc_price",
-                {
-                    "source_id": source_id,
-                    "apc_price_seq": seq,
-                    "apc_price": value,
-                    "currency": currency,
-                },
-            )
+            rows.append((source_id, len(rows) + 1, value, currency))
+        if rows:
+            self._emitter.emit_tuples("source_apc_price", rows)
 
     # ------------------------------------------------------------------
     @staticmethod
     def _normalize_issn(raw_value: object) -> str | None:
         if raw_value is None:
             return None
-        text = str(raw_value).strip()
+        # ISSN fields are already str in practice; skip the str() dispatch
+        # (strip() returns the original object when nothing is trimmed).
+        if type(raw_value) is str:
+            text = raw_value.strip()
+        else:
+            text = str(raw_value).strip()
         if not text:
             return None
         if ":" in text:
             text = text.rsplit(":", 1)[-1].strip()
         text = text.upper()
-        match = ISSN_PATTERN.search(text)
+        # Clean 9-character ISSNs are the overwhelmingly common case.
+        if _fast_issn(text):
+            return text
+        match = _ISSN_SEARCH(text)
         if match:
             return match.group(0)
-        if len(text) >= 9:
-            candidate = text[-9:]
-            if ISSN_PATTERN.fullmatch(candidate):
-                return candidate
         return None
 
     # ------------------------------------------------------------------
-    def _emit_issn(self, source_id: int, record: Dict[str, object]) -> None:
-        issns = record.get("issn") or (record.get("ids") or {}).get("issn") or []
-        seq = 0
-        seen = set()
-        for issn in issns:
-            normalized = self._normalize_issn(issn)
-            if not normalized or normalized in seen:
-                continue
-            seen.add(normalized)
-            seq += 1
-            self._emitter.emit(
-                "source_issn",
-                {
-                    "source_id": source_id,
-                    "issn_seq": seq,
-                    "issn": normalized,
-                },
-            )
+    def _emit_issn(self, source_id: int, issns: list) -> None:
+        # Normalise first, then dedupe_seq drops Nones and repeats in order.
+        self._emitter.emit_tuples(
+            "source_issn",
+            (
+                (source_id, seq, normalized)
+                for seq, normalized in dedupe_seq(map(self._normalize_issn, issns))
+            ),
+        )
 
     # ------------------------------------------------------------------
-    def _emit_societies(self, source_id: int, record: Dict[str, object]) -> None:
-        societies = record.get("societies") or []
-        seq = 0
+    def _emit_societies(self, source_id: int, societies: list) -> None:
+        rows = []
         for society in societies:
             if not isinstance(society, dict):
                 continue
@@ -185,16 +248,9 @@ class SourceTransformer:
             url = society.get("url")
             if not name and not url:
                 continue
-            seq += 1
-            self._emitter.emit(
-                "source_society",
-                {
-                    "source_id": source_id,
-                    "society_seq": seq,
-                    "society": name,
-                    "homepage_url": url,
-                },
-            )
+            rows.append((source_id, len(rows) + 1, name, url))
+        if rows:
+            self._emitter.emit_tuples("source_society", rows)
 
 
 __all__ = ["SourceTransformer"]
@@ -6,331 +6,312 @@ from typing import Dict, List
 from ..emitter import TableEmitter
 from ..utils import (
     canonical_wikidata_id,
+    dedupe_seq,
     numeric_openalex_id,
     parse_iso_date,
     parse_iso_datetime,
 )
 
+# Positional row layouts; each tuple must match the schema column order.
+DOMAIN_COLUMNS = (
+    "domain_id",
+    "domain",
+    "description",
+    "openalex_id",
+    "wikidata_id",
+    "wikipedia_url",
+    "updated_date",
+    "created_date",
+)
+DOMAIN_ALTERNATIVE_NAME_COLUMNS = ("domain_id", "alternative_name_seq", "alternative_name")
+DOMAIN_FIELD_COLUMNS = ("domain_id", "field_seq", "field_id")
+DOMAIN_SIBLING_COLUMNS = ("domain_id", "sibling_domain_seq", "sibling_domain_id")
+
+FIELD_COLUMNS = (
+    "field_id",
+    "field",
+    "description",
+    "openalex_id",
+    "wikidata_id",
+    "wikipedia_url",
+    "domain_id",
+    "updated_date",
+    "created_date",
+)
+FIELD_ALTERNATIVE_NAME_COLUMNS = ("field_id", "alternative_name_seq", "alternative_name")
+FIELD_SUBFIELD_COLUMNS = ("field_id", "subfield_seq", "subfield_id")
+FIELD_SIBLING_COLUMNS = ("field_id", "sibling_field_seq", "sibling_field_id")
+
+SUBFIELD_COLUMNS = (
+    "subfield_id",
+    "subfield",
+    "description",
+    "openalex_id",
+    "wikidata_id",
+    "wikipedia_url",
+    "domain_id",
+    "field_id",
+    "updated_date",
+    "created_date",
+)
+SUBFIELD_ALTERNATIVE_NAME_COLUMNS = ("subfield_id", "alternative_name_seq", "alternative_name")
+SUBFIELD_TOPIC_COLUMNS = ("subfield_id", "topic_seq", "topic_id")
+SUBFIELD_SIBLING_COLUMNS = ("subfield_id", "sibling_subfield_seq", "sibling_subfield_id")
+
+TOPIC_COLUMNS = (
+    "topic_id",
+    "topic",
+    "description",
+    "openalex_id",
+    "wikipedia_url",
+    "domain_id",
+    "field_id",
+    "subfield_id",
+    "updated_date",
+    "created_date",
+)
+TOPIC_KEYWORD_COLUMNS = ("topic_id", "keyword_seq", "keyword")
+TOPIC_SIBLING_COLUMNS = ("topic_id", "sibling_topic_seq", "sibling_topic_id")
+
+
+def _collect_id_rows(parent_id: int, items: object) -> List[tuple]:
+    """Build (parent_id, seq, item_id) rows for a list of id-bearing items."""
+
+    _ni = numeric_openalex_id
+    rows: List[tuple] = []
+    for item in items or ():
+        item_id = _ni(item.get("id")) if type(item) is dict else _ni(item)
+        if item_id is None:
+            continue
+        rows.append((parent_id, len(rows) + 1, item_id))
+    return rows
+
 
 class DomainTransformer:
+    __slots__ = ("_emitter",)
+
     def __init__(self, emitter: TableEmitter) -> None:
         self._emitter = emitter
+        emitter.register_schema("domain", DOMAIN_COLUMNS)
+        emitter.register_schema("domain_alternative_name", DOMAIN_ALTERNATIVE_NAME_COLUMNS)
+        emitter.register_schema("domain_field", DOMAIN_FIELD_COLUMNS)
+        emitter.register_schema("domain_sibling", DOMAIN_SIBLING_COLUMNS)
 
     def transform(self, record: Dict[str, object]) -> None:
-        domain_id = numeric_openalex_id(record.get("id"))
+        rget = record.get
+        domain_id = numeric_openalex_id(rget("id"))
         if domain_id is None:
             return
-        ids = record.get("ids") or {}
-        wikidata_id = canonical_wikidata_id(ids.get("wikidata"))
-        wikipedia_url = ids.get("wikipedia")
-        self._emitter.emit(
+        ids = rget("ids") or {}
+        self._emitter.emit_tuple(
             "domain",
-            {
-                "domain_id": domain_id,
-                "domain": record.get("display_name"),
-                "description": record.get("description"),
-                "openalex_id": domain_id,
-                "wikidata_id": wikidata_id,
-                "wikipedia_url": wikipedia_url,
-                "updated_date": parse_iso_datetime(record.get("updated_date")),
-                "created_date": parse_iso_date(record.get("created_date")),
-            },
+            (
+                domain_id,
+                rget("display_name"),
+                rget("description"),
+                domain_id,
+                canonical_wikidata_id(ids.get("wikidata")),
+                ids.get("wikipedia"),
+                parse_iso_datetime(rget("updated_date")),
+                parse_iso_date(rget("created_date")),
+            ),
         )
-        self._emit_alternative_names(domain_id, record)
-        self._emit_fields(domain_id, record)
-        self._emit_siblings(domain_id, record)
-
-    def _emit_alternative_names(self, domain_id: int, record: Dict[str, object]) -> None:
-        names = record.get("display_name_alternatives") or []
-        seq = 0
-        seen = set()
-        for name in names:
-            if not name or name in seen:
-                continue
-            seen.add(name)
-            seq += 1
-            self._emitter.emit(
-                "domain_alternative_name",
-                {
-                    "domain_id": domain_id,
-                    "alternative_name_seq": seq,
-                    "alternative_name": name,
-                },
-            )
-
-    def _emit_fields(self, domain_id: int, record: Dict[str, object]) -> None:
-        fields = record.get("fields") or []
-        seq = 0
-        for field in fields:
-            field_id = numeric_openalex_id(field.get("id")) if isinstance(field, dict) else numeric_openalex_id(field)
-            if field_id is None:
-                continue
-            seq += 1
-            self._emitter.emit(
-                "domain_field",
-                {
-                    "domain_id": domain_id,
-                    "field_seq": seq,
-                    "field_id": field_id,
-                },
-            )
-
-    def _emit_siblings(self, domain_id: int, record: Dict[str, object]) -> None:
-        siblings = record.get("siblings") or []
-        seq = 0
-        for sibling in siblings:
-            sibling_id = numeric_openalex_id(sibling.get("id")) if isinstance(sibling, dict) else numeric_openalex_id(sibling)
-            if sibling_id is None:
-                continue
-            seq += 1
-            self._emitter.emit(
-                "domain_sibling",
-                {
-                    "domain_id": domain_id,
-                    "sibling_domain_seq": seq,
-                    "sibling_domain_id": sibling_id,
-                },
-            )
+        names = rget("display_name_alternatives")
+        if names:
+            self._emit_alternative_names(domain_id, names)
+        fields = rget("fields")
+        if fields:
+            self._emit_fields(domain_id, fields)
+        siblings = rget("siblings")
+        if siblings:
+            self._emit_siblings(domain_id, siblings)
+
+    def _emit_alternative_names(self, domain_id: int, names: list) -> None:
+        self._emitter.emit_tuples(
+            "domain_alternative_name",
+            ((domain_id, seq, name) for seq, name in dedupe_seq(names)),
+        )
+
+    def _emit_fields(self, domain_id: int, fields: list) -> None:
+        rows = _collect_id_rows(domain_id, fields)
+        if rows:
+            self._emitter.emit_tuples("domain_field", rows)
+
+    def _emit_siblings(self, domain_id: int, siblings: list) -> None:
+        rows = _collect_id_rows(domain_id, siblings)
+        if rows:
+            self._emitter.emit_tuples("domain_sibling", rows)
 
 
 class FieldTransformer:
+    __slots__ = ("_emitter",)
+
     def __init__(self, emitter: TableEmitter) -> None:
         self._emitter = emitter
+        emitter.register_schema("field", FIELD_COLUMNS)
+        emitter.register_schema("field_alternative_name", FIELD_ALTERNATIVE_NAME_COLUMNS)
+        emitter.register_schema("field_subfield", FIELD_SUBFIELD_COLUMNS)
+        emitter.register_schema("field_sibling", FIELD_SIBLING_COLUMNS)
 
     def transform(self, record: Dict[str, object]) -> None:
-        field_id = numeric_openalex_id(record.get("id"))
+        rget = record.get
+        field_id = numeric_openalex_id(rget("id"))
         if field_id is None:
             return
-        ids = record.get("ids") or {}
-        domain = record.get("domain") or {}
-        domain_id = numeric_openalex_id(domain.get("id"))
-        wikidata_id = canonical_wikidata_id(ids.get("wikidata"))
-        wikipedia_url = ids.get("wikipedia")
-
-        self._emitter.emit(
+        ids = rget("ids") or {}
+        domain = rget("domain") or {}
+        self._emitter.emit_tuple(
             "field",
-            {
-                "field_id": field_id,
-                "field": record.get("display_name"),
-                "description": record.get("description"),
-                "openalex_id": field_id,
-                "wikidata_id": wikidata_id,
-                "wikipedia_url": wikipedia_url,
-                "domain_id": domain_id,
-                "updated_date": parse_iso_datetime(record.get("updated_date")),
-                "created_date": parse_iso_date(record.get("created_date")),
-            },
+            (
+                field_id,
+                rget("display_name"),
+                rget("description"),
+                field_id,
+                canonical_wikidata_id(ids.get("wikidata")),
+                ids.get("wikipedia"),
+                numeric_openalex_id(domain.get("id")),
+                parse_iso_datetime(rget("updated_date")),
+                parse_iso_date(rget("created_date")),
+            ),
         )
-        self._emit_alternative_names(field_id, record)
-        self._emit_subfields(field_id, record)
-        self._emit_siblings(field_id, record)
-
-    def _emit_alternative_names(self, field_id: int, record: Dict[str, object]) -> None:
-        names = record.get("display_name_alternatives") or []
-        seen = set()
-        seq = 0
-        for name in names:
-            if not name or name in seen:
-                continue
-            seen.add(name)
-            seq += 1
-            self._emitter.emit(
-                "field_alternative_name",
-                {
-                    "field_id": field_id,
-                    "alternative_name_seq": seq,
-                    "alternative_name": name,
-                },
-            )
-
-    def _emit_subfields(self, field_id: int, record: Dict[str, object]) -> None:
-        subfields = record.get("subfields") or []
-        seq = 0
-        for subfield in subfields:
-            subfield_id = numeric_openalex_id(subfield.get("id")) if isinstance(subfield, dict) else numeric_openalex_id(subfield)
-            if subfield_id is None:
-                continue
-            seq += 1
-            self._emitter.emit(
-                "field_subfield",
-                {
-                    "field_id": field_id,
-                    "subfield_seq": seq,
-                    "subfield_id": subfield_id,
-                },
-            )
-
-    def _emit_siblings(self, field_id: int, record: Dict[str, object]) -> None:
-        siblings = record.get("siblings") or []
-        seq = 0
-        for sibling in siblings:
-            sibling_id = numeric_openalex_id(sibling.get("id")) if isinstance(sibling, dict) else numeric_openalex_id(sibling)
-            if sibling_id is None:
-                continue
-            seq += 1
-            self._emitter.emit(
-                "field_sibling",
-                {
-                    "field_id": field_id,
-                    "sibling_field_seq": seq,
-                    "sibling_field_id": sibling_id,
-                },
-            )
+        names = rget("display_name_alternatives")
+        if names:
+            self._emit_alternative_names(field_id, names)
+        subfields = rget("subfields")
+        if subfields:
+            self._emit_subfields(field_id, subfields)
+        siblings = rget("siblings")
+        if siblings:
+            self._emit_siblings(field_id, siblings)
+
+    def _emit_alternative_names(self, field_id: int, names: list) -> None:
+        self._emitter.emit_tuples(
+            "field_alternative_name",
+            ((field_id, seq, name) for seq, name in dedupe_seq(names)),
+        )
+
+    def _emit_subfields(self, field_id: int, subfields: list) -> None:
+        rows = _collect_id_rows(field_id, subfields)
+        if rows:
+            self._emitter.emit_tuples("field_subfield", rows)
+
+    def _emit_siblings(self, field_id: int, siblings: list) -> None:
+        rows = _collect_id_rows(field_id, siblings)
+        if rows:
+            self._emitter.emit_tuples("field_sibling", rows)
 
 
 class SubfieldTransformer:
+    __slots__ = ("_emitter",)
+
     def __init__(self, emitter: TableEmitter) -> None:
         self._emitter = emitter
+        emitter.register_schema("subfield", SUBFIELD_COLUMNS)
+        emitter.register_schema("subfield_alternative_name", SUBFIELD_ALTERNATIVE_NAME_COLUMNS)
+        emitter.register_schema("subfield_topic", SUBFIELD_TOPIC_COLUMNS)
+        emitter.register_schema("subfield_sibling", SUBFIELD_SIBLING_COLUMNS)
 
     def transform(self, record: Dict[str, object]) -> None:
-        subfield_id = numeric_openalex_id(record.get("id"))
+        rget = record.get
+        subfield_id = numeric_openalex_id(rget("id"))
         if subfield_id is None:
             return
-        ids = record.get("ids") or {}
-        domain = record.get("domain") or {}
-        field = record.get("field") or {}
-        domain_id = numeric_openalex_id(domain.get("id"))
-        field_id = numeric_openalex_id(field.get("id"))
-        wikidata_id = canonical_wikidata_id(ids.get("wikidata"))
-        wikipedia_url = ids.get("wikipedia")
-
-        self._emitter.emit(
+        ids = rget("ids") or {}
+        domain = rget("domain") or {}
+        field = rget("field") or {}
+        self._emitter.emit_tuple(
             "subfield",
-            {
-                "subfield_id": subfield_id,
-                "subfield": record.get("display_name"),
-                "description": record.get("description"),
-                "openalex_id": subfield_id,
-                "wikidata_id": wikidata_id,
-                "wikipedia_url": wikipedia_url,
-                "domain_id": domain_id,
-                "field_id": field_id,
-                "updated_date": parse_iso_datetime(record.get("updated_date")),
-                "created_date": parse_iso_date(record.get("created_date")),
-            },
+            (
+                subfield_id,
+                rget("display_name"),
+                rget("description"),
+                subfield_id,
+                canonical_wikidata_id(ids.get("wikidata")),
+                ids.get("wikipedia"),
+                numeric_openalex_id(domain.get("id")),
+                numeric_openalex_id(field.get("id")),
+                parse_iso_datetime(rget("updated_date")),
+                parse_iso_date(rget("created_date")),
+            ),
         )
-        self._emit_alternative_names(subfield_id, record)
-        self._emit_topics(subfield_id, record)
-        self._emit_siblings(subfield_id, record)
-
-    def _emit_alternative_names(self, subfield_id: int, record: Dict[str, object]) -> None:
-        names = record.get("display_name_alternatives") or []
-        seen = set()
-        seq = 0
-        for name in names:
-            if not name or name in seen:
-                continue
-            seen.add(name)
-            seq += 1
-            self._emitter.emit(
-                "subfield_alternative_name",
-                {
-                    "subfield_id": subfield_id,
-                    "alternative_name_seq": seq,
-                    "alternative_name": name,
-                },
-            )
-
-    def _emit_topics(self, subfield_id: int, record: Dict[str, object]) -> None:
-        topics = record.get("topics") or []
-        seq = 0
-        for topic in topics:
-            topic_id = numeric_openalex_id(topic.get("id")) if isinstance(topic, dict) else numeric_openalex_id(topic)
-            if topic_id is None:
-                continue
-            seq += 1
-            self._emitter.emit(
-                "subfield_topic",
-                {
-                    "subfield_id": subfield_id,
-                    "topic_seq": seq,
-                    "topic_id": topic_id,
-                },
-            )
-
-    def _emit_siblings(self, subfield_id: int, record: Dict[str, object]) -> None:
-        siblings = record.get("siblings") or []
-        seq = 0
-        for sibling in siblings:
-            sibling_id = numeric_openalex_id(sibling.get("id")) if isinstance(sibling, dict) else numeric_openalex_id(sibling)
-            if sibling_id is None:
-                continue
-            seq += 1
-            self._emitter.emit(
-                "subfield_sibling",
-                {
-                    "subfield_id": subfield_id,
-                    "sibling_subfield_seq": seq,
-                    "sibling_subfield_id": sibling_id,
-                },
-            )
+        names = rget("display_name_alternatives")
+        if names:
+            self._emit_alternative_names(subfield_id, names)
+        topics = rget("topics")
+        if topics:
+            self._emit_topics(subfield_id, topics)
+        siblings = rget("siblings")
+        if siblings:
+            self._emit_siblings(subfield_id, siblings)
+
+    def _emit_alternative_names(self, subfield_id: int, names: list) -> None:
+        self._emitter.emit_tuples(
+            "subfield_alternative_name",
+            ((subfield_id, seq, name) for seq, name in dedupe_seq(names)),
+        )
+
+    def _emit_topics(self, subfield_id: int, topics: list) -> None:
+        rows = _collect_id_rows(subfield_id, topics)
+        if rows:
+            self._emitter.emit_tuples("subfield_topic", rows)
+
+    def _emit_siblings(self, subfield_id: int, siblings: list) -> None:
+        rows = _collect_id_rows(subfield_id, siblings)
+        if rows:
+            self._emitter.emit_tuples("subfield_sibling", rows)
 
 
 class TopicTransformer:
+    __slots__ = ("_emitter",)
+
     def __init__(self, emitter: TableEmitter) -> None:
         self._emitter = emitter
+        emitter.register_schema("topic", TOPIC_COLUMNS)
+        emitter.register_schema("topic_keyword", TOPIC_KEYWORD_COLUMNS)
+        emitter.register_schema("topic_sibling", TOPIC_SIBLING_COLUMNS)
 
     def transform(self, record: Dict[str, object]) -> None:
-        topic_id = numeric_openalex_id(record.get("id"))
+        rget = record.get
+        topic_id = numeric_openalex_id(rget("id"))
         if topic_id is None:
             return
-        domain = record.get("domain") or {}
-        field = record.get("field") or {}
-        subfield = record.get("subfield") or {}
-        domain_id = numeric_openalex_id(domain.get("id"))
-        field_id = numeric_openalex_id(field.get("id"))
-        subfield_id = numeric_openalex_id(subfield.get("id"))
-
-        self._emitter.emit(
+        ids = rget("ids") or {}
+        wikipedia_url = ids.get("wikipedia")
+        domain = rget("domain") or {}
+        field = rget("field") or {}
+        subfield = rget("subfield") or {}
+        self._emitter.emit_tuple(
             "topic",
-            {
-                "topic_id": topic_id,
-                "topic": record.get("display_name"),
-                "description": record.get("description"),
-                "openalex_id": topic_id,
-                "wikipedia_url": (record.get("ids") or {}).get("wikipedia"),
-                "domain_id": domain_id,
-                "field_id": field_id,
-                "subfield_id": subfield_id,
-                "updated_date": parse_iso_datetime(record.get("updated_date")),
-                "created_date": parse_iso_date(record.get("created_date")),
-            },
+            (
+                topic_id,
+                rget("display_name"),
+                rget("description"),
+                topic_id,
+                wikipedia_url,
+                numeric_openalex_id(domain.get("id")),
+                numeric_openalex_id(field.get("id")),
+                numeric_openalex_id(subfield.get("id")),
+                parse_iso_datetime(rget("updated_date")),
+                parse_iso_date(rget("created_date")),
+            ),
+        )
+        keywords = rget("keywords")
+        if keywords:
+            self._emit_keywords(topic_id, keywords)
+        siblings = rget("siblings")
+        if siblings:
+            self._emit_siblings(topic_id, siblings)
+
+    def _emit_keywords(self, topic_id: int, keywords: list) -> None:
+        self._emitter.emit_tuples(
+            "topic_keyword",
+            ((topic_id, seq, keyword) for seq, keyword in enumerate(filter(None, keywords), start=1)),
         )
-        self._emit_keywords(topic_id, record)
-        self._emit_siblings(topic_id, record)
-
-    def _emit_keywords(self, topic_id: int, record: Dict[str, object]) -> None:
-        keywords = record.get("keywords") or []
-        seq = 0
-        for keyword in keywords:
-            if not keyword:
-                continue
-            seq += 1
-            self._emitter.emit(
-                "topic_keyword",
-                {
-                    "topic_id": topic_id,
-                    "keyword_seq": seq,
-                    "keyword": keyword,
-                },
-            )
-
-    def _emit_siblings(self, topic_id: int, record: Dict[str, object]) -> None:
-        siblings = record.get("siblings") or []
-        seq = 0
-        for sibling in siblings:
-            sibling_id = numeric_openalex_id(sibling.get("id")) if isinstance(sibling, dict) else numeric_openalex_id(sibling)
-            if sibling_id is None:
-                continue
-            seq += 1
-            self._emitter.emit(
-                "topic_sibling",
-                {
-                    "topic_id": topic_id,
-                    "sibling_topic_seq": seq,
-                    "sibling_topic_id": sibling_id,
-                },
-            )
+
+    def _emit_siblings(self, topic_id: int, siblings: list) -> None:
+        rows = _collect_id_rows(topic_id, siblings)
+        if rows:
+            self._emitter.emit_tuples("topic_sibling", rows)
 
 
 __all__ = [
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
-from typing import Any, Mapping, Optional
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Mapping, Optional, Tuple
 
 ISO_DATE_FORMATS = ["%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"]
 
@@ -42,11 +43,8 @@ def lookup_id(ids: Mapping[str, Any], key: str) -> Optional[str]:
     return str(value)
 
 
-def parse_iso_datetime(value: Optional[str]) -> Optional[str]:
-    """Coerce timestamps to ISO8601 date/time strings."""
-
-    if not value:
-        return None
+@lru_cache(maxsize=8192)
+def _parse_iso_datetime_cached(value: str) -> Optional[str]:
     for fmt in ISO_DATE_FORMATS:
         try:
             dt = datetime.strptime(value, fmt)
@@ -59,6 +57,18 @@ def parse_iso_datetime(value: Optional[str]) -> Optional[str]:
     return value
 
 
+def parse_iso_datetime(value: Optional[str]) -> Optional[str]:
+    """Coerce timestamps to ISO8601 date/time strings.
+
+    Snapshot records overwhelmingly repeat a few distinct dates, so results
+    are memoised; strptime only runs once per distinct input string.
+    """
+
+    if not value:
+        return None
+    return _parse_iso_datetime_cached(value)
+
+
 def parse_iso_date(value: Optional[str]) -> Optional[str]:
     """Return YYYY-MM-DD if possible."""
 
@@ -131,6 +141,16 @@ def safe_float(value: Any) -> Optional[float]:
         return None
 
 
+def dedupe_seq(values: Iterable[Any]) -> Iterator[Tuple[int, Any]]:
+    """Yield (seq, value) pairs over truthy values, de-duplicated in order.
+
+    dict.fromkeys performs the order-preserving dedup at C level, replacing
+    the hand-rolled seen-set/seq-counter loops in the transformers.
+    """
+
+    return enumerate(dict.fromkeys(value for value in values if value), start=1)
+
+
 def bool_from_flag(value: Any) -> Optional[bool]:
     if value is None:
         return None
@@ -155,6 +175,7 @@ __all__ = [
     "safe_int",
     "safe_float",
     "bool_from_flag",
+    "dedupe_seq",
     "extract_numeric_id",
     "normalise_language_code",
 ]
@@ -175,6 +196,16 @@ def canonical_wikidata_id(value: Optional[str]) -> Optional[str]:
     return value or None
 
 
+def canonical_ror_id(value: Optional[str]) -> Optional[str]:
+    """Return the terminal ROR identifier segment (e.g. 027bh9e22) from a URL."""
+
+    if not value:
+        return None
+    # rpartition avoids the list allocation of split()[-1] on this hot path.
+    tail = value.rstrip('/').rpartition('/')[2]
+    return tail or None
+
+
 _ORCID_PATTERN = re.compile(r"\d{4}-\d{4}-\d{4}-\d{3}[0-9X]", re.IGNORECASE)
 _ORCID_COMPACT_PATTERN = re.compile(r"\b\d{15}[0-9X]\b", re.IGNORECASE)
 _SCOPUS_AUTHOR_ID_PATTERN = re.compile(r"authorid=(\d+)", re.IGNORECASE)
@@ -230,6 +261,7 @@ def extract_scopus_author_id(value: Optional[str]) -> Optional[int]:
 
 __all__.extend([
     'canonical_wikidata_id',
+    'canonical_ror_id',
     'canonical_orcid',
     'extract_scopus_author_id',
 ])